@@ -291,6 +291,7 @@ def sync(
             token,
             refresh_client_id=settings.x.client_id,
             refresh_client_secret=settings.x.client_secret,
+            cache_dir=settings.x.cache_dir,
         )
         raindrop_client = RaindropClient(settings.raindrop.token)
         state = SyncState(settings.sync.state_path)
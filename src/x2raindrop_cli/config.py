@@ -72,6 +72,7 @@ class XSettings(BaseSettings):
         access_token: Direct access token (alternative to PKCE flow).
         refresh_token: Refresh token for direct access token refresh (optional).
         bearer_token: App-only bearer token (limited functionality, read-only).
+        cache_dir: Directory for cached X API responses (disabled if unset).
     """
 
     model_config = SettingsConfigDict(
@@ -110,6 +111,12 @@ class XSettings(BaseSettings):
         description="App-only bearer token (limited functionality)",
     )
 
+    # Conditional GET cache for bookmark pages
+    cache_dir: Path | None = Field(
+        None,
+        description="Directory for cached X API responses (disabled if unset)",
+    )
+
     def has_direct_token(self) -> bool:
         """Check if a direct token is configured.
 
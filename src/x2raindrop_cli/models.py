@@ -6,10 +6,16 @@ items to be created in Raindrop.io.
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import StrEnum
 
-from pydantic import BaseModel, ConfigDict, Field
+# Maximum length of a generated bookmark title
+TITLE_MAX_LENGTH = 150
+
+# Tweet text kept after the author prefix before truncating with "..."
+TITLE_TEXT_PREVIEW_LENGTH = 100
 
 
 class LinkMode(StrEnum):
@@ -39,7 +45,8 @@ class BothBehavior(StrEnum):
     TWO_RAINDROPS = "two_raindrops"
 
 
-class BookmarkItem(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class BookmarkItem:
     """Represents a bookmark from X (Twitter).
 
     Attributes:
@@ -52,15 +59,13 @@ class BookmarkItem(BaseModel):
         external_urls: List of external URLs found in the tweet.
     """
 
-    model_config = ConfigDict(frozen=True)
-
-    tweet_id: str = Field(..., description="Unique tweet identifier")
-    text: str = Field(..., description="Tweet text content")
-    author_username: str | None = Field(None, description="Author's username")
-    author_name: str | None = Field(None, description="Author's display name")
-    created_at: datetime | None = Field(None, description="Tweet creation timestamp")
-    permalink: str = Field(..., description="Direct URL to the tweet")
-    external_urls: list[str] = Field(default_factory=list, description="External URLs in tweet")
+    tweet_id: str
+    text: str
+    author_username: str | None = None
+    author_name: str | None = None
+    created_at: datetime | None = None
+    permalink: str
+    external_urls: list[str] = field(default_factory=list)
 
     def get_title(self) -> str:
         """Generate a title for the bookmark.
@@ -68,19 +73,19 @@ class BookmarkItem(BaseModel):
         Returns:
             A title string, preferring author info if available.
         """
+        text = self.text
         if self.author_username:
             prefix = f"@{self.author_username}"
             if self.author_name:
                 prefix = f"{self.author_name} ({prefix})"
-            return (
-                f"{prefix}: {self.text[:100]}..."[:150]
-                if len(self.text) > 100
-                else f"{prefix}: {self.text}"
-            )
-        return self.text[:150] if len(self.text) > 150 else self.text
+            if len(text) > TITLE_TEXT_PREVIEW_LENGTH:
+                return f"{prefix}: {text[:TITLE_TEXT_PREVIEW_LENGTH]}..."[:TITLE_MAX_LENGTH]
+            return f"{prefix}: {text}"
+        return text[:TITLE_MAX_LENGTH]
 
 
-class RaindropCreateRequest(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class RaindropCreateRequest:
     """Request to create a Raindrop item.
 
     Attributes:
@@ -92,18 +97,17 @@ class RaindropCreateRequest(BaseModel):
         note: Optional note content.
     """
 
-    model_config = ConfigDict(frozen=True)
+    link: str
+    title: str | None = None
+    excerpt: str | None = None
+    tags: tuple[str, ...] = ()
+    collection_id: int
+    note: str | None = None
+    source_tweet_id: str
 
-    link: str = Field(..., description="URL to bookmark")
-    title: str | None = Field(None, description="Bookmark title")
-    excerpt: str | None = Field(None, description="Excerpt/description")
-    tags: list[str] = Field(default_factory=list, description="Tags to apply")
-    collection_id: int = Field(..., description="Target Raindrop collection ID")
-    note: str | None = Field(None, description="Additional note content")
-    source_tweet_id: str = Field(..., description="Source X tweet ID for tracking")
 
-
-class SyncedBookmark(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SyncedBookmark:
     """Record of a successfully synced bookmark.
 
     Attributes:
@@ -113,15 +117,14 @@ class SyncedBookmark(BaseModel):
         deleted_from_x: Whether it was removed from X bookmarks.
     """
 
-    model_config = ConfigDict(frozen=True)
-
-    tweet_id: str = Field(..., description="Source X tweet ID")
-    raindrop_links: list[str] = Field(default_factory=list, description="Created Raindrop URLs")
-    synced_at: datetime = Field(default_factory=datetime.now, description="Sync timestamp")
-    deleted_from_x: bool = Field(False, description="Whether deleted from X")
+    tweet_id: str
+    raindrop_links: list[str] = field(default_factory=list)
+    synced_at: datetime = field(default_factory=datetime.now)
+    deleted_from_x: bool = False
 
 
-class SyncResult(BaseModel):
+@dataclass(slots=True)
+class SyncResult:
     """Result of a sync operation.
 
     Attributes:
@@ -138,7 +141,7 @@ class SyncResult(BaseModel):
     newly_synced: int = 0
     failed: int = 0
     deleted_from_x: int = 0
-    errors: list[str] = Field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
 
     def add_error(self, error: str) -> None:
         """Add an error message to the result.
@@ -147,3 +150,11 @@ class SyncResult(BaseModel):
             error: The error message to add.
         """
         self.errors.append(error)
+
+    def add_errors(self, errors: Iterable[str]) -> None:
+        """Add several error messages to the result.
+
+        Args:
+            errors: The error messages to add.
+        """
+        self.errors.extend(errors)
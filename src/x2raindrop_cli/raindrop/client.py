@@ -6,25 +6,94 @@ for creating bookmarks and listing collections.
 
 from __future__ import annotations
 
+import functools
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Protocol, cast
-from urllib.parse import quote
+from urllib.parse import quote, urlsplit, urlunsplit
 
+import orjson
 import structlog
 from raindropio import API, Collection, CollectionRef, Raindrop
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from x2raindrop_cli.models import RaindropCreateRequest
 
 if TYPE_CHECKING:
-    pass
+    from collections.abc import Set
+
+    from urllib3 import BaseHTTPResponse
 
 logger = structlog.get_logger(__name__)
 
 # Maximum number of items accepted by Raindrop bulk create endpoint
 MAX_BATCH_CREATE_SIZE = 100
 
+# Requests kept in flight at once for bulk creates and link prefetching
+# (Raindrop allows 120 requests/min)
+MAX_CONCURRENT_REQUESTS = 4
+
+# Page size used when listing raindrops (the API maximum)
+PREFETCH_PAGE_SIZE = 50
+
+# Duplicate checks a sync must announce for a collection before prefetching
+# its links is considered; smaller syncs search for each link instead
+PREFETCH_MIN_LINK_CHECKS = 10
+
+# Prefetch only when the announced checks are at least this many times the
+# number of pages the prefetch needs, so large collections are not paged in
+# for a handful of new links
+PREFETCH_MIN_CHECKS_PER_PAGE = 2
+
+# Raindrop REST API base URL
+API_BASE_URL = "https://api.raindrop.io/rest/v1"
+
+# Longest wait honoured for a rate-limit reset (Raindrop windows are one minute)
+MAX_RATE_LIMIT_WAIT_SECONDS = 60.0
+
+
+class RateLimitRetry(Retry):
+    """Retry policy that also resends rate-limited (429) requests of any method.
+
+    A 429 means Raindrop rejected the request without processing it, so even
+    bulk-create POSTs can be resent safely. The wait honours ``Retry-After`` and
+    falls back to Raindrop's ``X-RateLimit-Reset`` header (epoch seconds).
+    """
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        """Check whether a response should be retried."""
+        if status_code == 429:
+            return True
+        return super().is_retry(method, status_code, has_retry_after)
+
+    def get_retry_after(self, response: BaseHTTPResponse) -> float | None:
+        """Get the number of seconds to wait before retrying a response."""
+        retry_after = super().get_retry_after(response)
+        if retry_after is None and response.status == 429:
+            reset = response.headers.get("X-RateLimit-Reset")
+            if reset is not None and reset.isdigit():
+                retry_after = max(0.0, int(reset) - time.time())
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RATE_LIMIT_WAIT_SECONDS)
+
+
+# Retries for rate-limited requests and for transient server errors on
+# idempotent requests (5xx POSTs are not retried, so bulk creates are not
+# duplicated)
+REQUEST_RETRY = RateLimitRetry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(500, 502, 503, 504),
+    raise_on_status=False,
+)
+
 
-@dataclass
+@dataclass(slots=True)
 class RaindropCollection:
     """Represents a Raindrop.io collection.
 
@@ -41,7 +110,7 @@ class RaindropCollection:
     parent_id: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CreatedRaindrop:
     """Represents a successfully created Raindrop.
 
@@ -102,6 +171,15 @@ class RaindropClientProtocol(Protocol):
         """
         ...
 
+    def expect_link_checks(self, count: int, collection_id: int | None = None) -> None:
+        """Announce how many links are about to be checked for existence.
+
+        Args:
+            count: Number of upcoming `check_link_exists` calls.
+            collection_id: Collection the links will be checked in.
+        """
+        ...
+
     def check_link_exists(self, link: str, collection_id: int | None = None) -> bool:
         """Check if a link already exists in Raindrop.
 
@@ -130,14 +208,55 @@ class RaindropClient:
         """
         self.token = token
         self._api: API | None = None
+        self._collections_cache: list[RaindropCollection] | None = None
+        # Case-folded title -> first collection with that title
+        self._collections_by_title: dict[str, RaindropCollection] = {}
+        # Collection ID (0 = all collections) -> normalized links it contains
+        self._known_links: dict[int, set[str]] = {}
+        # Collection ID -> announced number of upcoming duplicate checks
+        self._expected_link_checks: dict[int, int] = {}
+        # (collection ID, normalized link) -> result of a per-link search
+        self._searched_links: dict[tuple[int, str], bool] = {}
+        self._link_cache_lock = threading.Lock()
+        self._api_lock = threading.Lock()
 
     @property
     def api(self) -> API:
-        """Get or create the API client."""
-        if self._api is None:
-            self._api = API(self.token)
+        """Get or create the API client (safe to call from worker threads)."""
+        if self._api is not None:
+            return self._api
+        with self._api_lock:
+            if self._api is not None:
+                return self._api
+            api = API(self.token)
+            if api.session is not None:
+                # One keep-alive connection per concurrent worker
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=MAX_CONCURRENT_REQUESTS,
+                    max_retries=REQUEST_RETRY,
+                )
+                api.session.mount("https://", adapter)
+            self._api = api
         return self._api
 
+    def _wait_for_rate_limit(self) -> None:
+        """Sleep until the rate-limit window resets if the budget is exhausted.
+
+        Called before issuing requests so an exhausted window costs a wait
+        instead of a rejected (429) request.
+        """
+        api = self.api
+        if api.ratelimit_remaining != 0 or api.ratelimit_reset is None:
+            return
+        wait = api.ratelimit_reset - time.time()
+        if wait <= 0:
+            return
+
+        wait = min(wait, MAX_RATE_LIMIT_WAIT_SECONDS)
+        logger.warning("Raindrop rate limit exhausted; waiting for reset", wait_seconds=round(wait))
+        time.sleep(wait)
+
     def __enter__(self) -> RaindropClient:
         """Context manager entry."""
         return self
@@ -172,35 +291,37 @@ class RaindropClient:
     def list_collections(self) -> list[RaindropCollection]:
         """List all collections (root and children).
 
+        The result is fetched once and cached; call `refresh_collections` to
+        reload it.
+
         Returns:
             List of all collections.
         """
-        collections: list[RaindropCollection] = []
-
-        # Get root collections
-        for c in Collection.get_roots(self.api):
-            collections.append(
-                RaindropCollection(
-                    id=c.id,
-                    title=c.title,
-                    count=c.count,
-                    parent_id=self._get_parent_id(c),
-                )
+        if self._collections_cache is not None:
+            return list(self._collections_cache)
+
+        # Root collections followed by child collections
+        get_parent_id = self._get_parent_id
+        collections = [
+            RaindropCollection(id=c.id, title=c.title, count=c.count, parent_id=get_parent_id(c))
+            for c in itertools.chain(
+                Collection.get_roots(self.api), Collection.get_childrens(self.api)
             )
+        ]
 
-        # Get child collections
-        for c in Collection.get_childrens(self.api):
-            collections.append(
-                RaindropCollection(
-                    id=c.id,
-                    title=c.title,
-                    count=c.count,
-                    parent_id=self._get_parent_id(c),
-                )
-            )
+        by_title: dict[str, RaindropCollection] = {}
+        for collection in collections:
+            by_title.setdefault(collection.title.casefold(), collection)
+        self._collections_cache = collections
+        self._collections_by_title = by_title
 
         logger.debug("Listed collections", count=len(collections))
-        return collections
+        return list(collections)
+
+    def refresh_collections(self) -> None:
+        """Drop the cached collections so the next lookup reloads them."""
+        self._collections_cache = None
+        self._collections_by_title = {}
 
     def get_collection_by_title(self, title: str) -> RaindropCollection | None:
         """Find a collection by its title.
@@ -211,11 +332,9 @@ class RaindropClient:
         Returns:
             Collection if found, None otherwise.
         """
-        title_lower = title.lower()
-        for collection in self.list_collections():
-            if collection.title.lower() == title_lower:
-                return collection
-        return None
+        if self._collections_cache is None:
+            self.list_collections()
+        return self._collections_by_title.get(title.casefold())
 
     def get_collection_ref(self, collection_id: int) -> CollectionRef | Collection:
         """Get a collection reference for use in Raindrop creation.
@@ -226,15 +345,7 @@ class RaindropClient:
         Returns:
             CollectionRef or Collection instance for the ID.
         """
-        # Check for special collection IDs
-        if collection_id == -1:
-            return CollectionRef.Unsorted
-        if collection_id == -99:
-            return CollectionRef.Trash
-
-        # For regular collections, create a reference
-        # We use CollectionRef with the ID
-        return CollectionRef({"$id": collection_id})
+        return _make_collection_ref(collection_id)
 
     def create_raindrop(self, request: RaindropCreateRequest) -> CreatedRaindrop:
         """Create a new Raindrop bookmark.
@@ -257,7 +368,9 @@ class RaindropClient:
             tags=request.tags,
         )
 
+        self._wait_for_rate_limit()
         raindrop = Raindrop.create(self.api, **create_kwargs)
+        self._remember_created_links([request])
 
         logger.info(
             "Created raindrop",
@@ -316,63 +429,108 @@ class RaindropClient:
         """Create multiple Raindrop bookmarks using the bulk endpoint.
 
         Raindrop currently accepts up to 100 items per request, so larger
-        payloads are automatically split into multiple API calls.
+        payloads are automatically split into multiple API calls. Those calls
+        are sent concurrently (up to `MAX_CONCURRENT_REQUESTS` at a time) and
+        the results are returned in request order.
         """
         if not requests:
             return []
 
-        created_raindrops: list[CreatedRaindrop] = []
-        bulk_create_url = "https://api.raindrop.io/rest/v1/raindrops"
+        batches = [
+            requests[batch_start : batch_start + MAX_BATCH_CREATE_SIZE]
+            for batch_start in range(0, len(requests), MAX_BATCH_CREATE_SIZE)
+        ]
+
+        if len(batches) == 1:
+            batch_results = [self._create_raindrops_batch(batches[0])]
+        else:
+            # Create the lazily-initialized API session before fanning out.
+            _ = self.api
+            workers = min(MAX_CONCURRENT_REQUESTS, len(batches))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                batch_results = list(executor.map(self._create_raindrops_batch, batches))
+
+        created_raindrops = [raindrop for batch in batch_results for raindrop in batch]
+        self._remember_created_links(requests)
+        logger.info("Created raindrops in bulk", count=len(created_raindrops))
+        return created_raindrops
+
+    def _create_raindrops_batch(
+        self, batch_requests: list[RaindropCreateRequest]
+    ) -> list[CreatedRaindrop]:
+        """Create one batch of Raindrops with a single bulk API call.
+
+        Args:
+            batch_requests: Up to `MAX_BATCH_CREATE_SIZE` requests.
+
+        Returns:
+            Created Raindrop details in the same order as the batch.
+
+        Raises:
+            ValueError: If the response does not match the batch.
+        """
+        payload = {"items": [self._request_to_bulk_payload(r) for r in batch_requests]}
 
-        for batch_start in range(0, len(requests), MAX_BATCH_CREATE_SIZE):
-            batch_requests = requests[batch_start : batch_start + MAX_BATCH_CREATE_SIZE]
-            payload = {"items": [self._request_to_bulk_payload(r) for r in batch_requests]}
+        logger.debug("Creating raindrops batch", batch_size=len(batch_requests))
+        self._wait_for_rate_limit()
+        response = self.api.post(f"{API_BASE_URL}/raindrops", json=payload)
+        response.raise_for_status()
+        response_data = orjson.loads(response.content)
 
-            logger.debug(
-                "Creating raindrops batch",
-                batch_size=len(batch_requests),
-                total_requests=len(requests),
+        items = response_data.get("items", [])
+        if not isinstance(items, list) or len(items) != len(batch_requests):
+            msg = (
+                "Unexpected bulk create response: number of returned items does not "
+                "match the request size"
             )
-            response = self.api.post(bulk_create_url, json=payload)
-            response.raise_for_status()
-            response_data = response.json()
-
-            items = response_data.get("items", [])
-            if not isinstance(items, list) or len(items) != len(batch_requests):
-                msg = (
-                    "Unexpected bulk create response: number of returned items does not "
-                    "match the request size"
-                )
-                raise ValueError(msg)
-
-            for request, item in zip(batch_requests, items, strict=True):
-                if not isinstance(item, dict):
-                    raise ValueError("Unexpected bulk create response: item is not an object")
-                item_data = cast(dict[str, Any], item)
-
-                item_id = item_data.get("_id")
-                if item_id is None:
-                    item_id = item_data.get("id")
-                if item_id is None:
-                    raise ValueError("Unexpected bulk create response: missing item id")
-
-                item_title = item_data.get("title")
-                item_link = item_data.get("link")
-                created_raindrops.append(
-                    CreatedRaindrop(
-                        id=int(item_id),
-                        link=str(item_link) if item_link is not None else request.link,
-                        title=str(item_title) if item_title is not None else (request.title or ""),
-                        collection_id=request.collection_id,
-                    )
-                )
+            raise ValueError(msg)
 
-        logger.info("Created raindrops in bulk", count=len(created_raindrops))
+        created_raindrops: list[CreatedRaindrop] = []
+        for request, item in zip(batch_requests, items, strict=True):
+            if not isinstance(item, dict):
+                raise ValueError("Unexpected bulk create response: item is not an object")
+            item_data = cast(dict[str, Any], item)
+
+            item_id = item_data.get("_id")
+            if item_id is None:
+                item_id = item_data.get("id")
+            if item_id is None:
+                raise ValueError("Unexpected bulk create response: missing item id")
+
+            item_title = item_data.get("title")
+            item_link = item_data.get("link")
+            created_raindrops.append(
+                CreatedRaindrop(
+                    id=int(item_id),
+                    link=str(item_link) if item_link is not None else request.link,
+                    title=str(item_title) if item_title is not None else (request.title or ""),
+                    collection_id=request.collection_id,
+                )
+            )
         return created_raindrops
 
+    def expect_link_checks(self, count: int, collection_id: int | None = None) -> None:
+        """Announce how many links are about to be checked for existence.
+
+        Large syncs let `check_link_exists` prefetch the collection's links
+        once instead of searching for every link (see `_prefetch_links`).
+
+        Args:
+            count: Number of upcoming `check_link_exists` calls.
+            collection_id: Collection the links will be checked in.
+        """
+        scope = collection_id if collection_id is not None else 0
+        with self._link_cache_lock:
+            self._expected_link_checks[scope] = count
+
     def check_link_exists(self, link: str, collection_id: int | None = None) -> bool:
         """Check if a link already exists in Raindrop.
 
+        Uses the collection's prefetched links when a large number of checks
+        was announced with `expect_link_checks`; otherwise searches for the
+        link, caching the result. Links created through this client are
+        recorded as existing either way.
+
         Args:
             link: URL to check.
             collection_id: Optional collection to search in.
@@ -380,33 +538,203 @@ class RaindropClient:
         Returns:
             True if the link exists.
         """
-        normalized_link = self._normalize_link(link)
-        collection_path = str(collection_id) if collection_id is not None else "0"
-        search_term = quote(link, safe="")
-        search_url = (
-            f"https://api.raindrop.io/rest/v1/raindrops/{collection_path}"
-            f"?search={search_term}&perpage=100"
+        scope = collection_id if collection_id is not None else 0
+        normalized_link = _normalize_link(link)
+        known = self._get_known_links(scope)
+        if known is not None:
+            return normalized_link in known
+
+        cache_key = (scope, normalized_link)
+        with self._link_cache_lock:
+            cached = self._searched_links.get(cache_key)
+        if cached is not None:
+            return cached
+
+        exists = self._search_link(link, normalized_link, scope)
+        with self._link_cache_lock:
+            self._searched_links[cache_key] = exists
+        return exists
+
+    def _get_known_links(self, collection_id: int) -> set[str] | None:
+        """Get the prefetched links of a collection, prefetching them if worthwhile.
+
+        The prefetch decision is made once, on the first check after
+        `expect_link_checks`.
+
+        Args:
+            collection_id: Collection ID (0 for all collections).
+
+        Returns:
+            Set of normalized links, or None if links are searched one by one.
+        """
+        with self._link_cache_lock:
+            known = self._known_links.get(collection_id)
+            expected_checks = self._expected_link_checks.pop(collection_id, 0)
+        if known is not None or expected_checks < PREFETCH_MIN_LINK_CHECKS:
+            return known
+
+        links = self._prefetch_links(collection_id, expected_checks)
+        if links is None:
+            return None
+        with self._link_cache_lock:
+            return self._known_links.setdefault(collection_id, links)
+
+    def _prefetch_links(self, collection_id: int, expected_checks: int) -> set[str] | None:
+        """Download every link stored in a collection, if that is cheaper.
+
+        Costs one request per `PREFETCH_PAGE_SIZE` raindrops, instead of one
+        search request per checked link. The first page reports the total
+        count; the remaining pages are only fetched (concurrently) when the
+        expected checks are at least `PREFETCH_MIN_CHECKS_PER_PAGE` times the
+        page count.
+
+        Args:
+            collection_id: Collection ID (0 for all collections).
+            expected_checks: Number of announced duplicate checks.
+
+        Returns:
+            Set of normalized links, or None if the collection is too large
+            (or its size unknown) to be worth prefetching.
+        """
+        url = f"{API_BASE_URL}/raindrops/{collection_id}"
+        first_links, item_count, total = self._fetch_links_page(url, 0)
+        links = set(first_links)
+        page_count = 1
+
+        if item_count == PREFETCH_PAGE_SIZE:
+            if total is not None:
+                page_count = -(-total // PREFETCH_PAGE_SIZE)
+            if total is None or expected_checks < PREFETCH_MIN_CHECKS_PER_PAGE * page_count:
+                logger.debug(
+                    "Collection too large to prefetch; searching links individually",
+                    collection_id=collection_id,
+                    total=total,
+                    expected_checks=expected_checks,
+                )
+                return None
+
+            remaining_pages = range(1, page_count)
+            _ = self.api  # initialize the session before fanning out
+            with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+                for page_links, _, _ in executor.map(
+                    lambda page: self._fetch_links_page(url, page), remaining_pages
+                ):
+                    links.update(page_links)
+
+        logger.debug(
+            "Prefetched existing links",
+            collection_id=collection_id,
+            count=len(links),
+            pages=page_count,
+        )
+        return links
+
+    def _search_link(self, link: str, normalized_link: str, collection_id: int) -> bool:
+        """Search Raindrop for an exact (normalized) link match.
+
+        Args:
+            link: URL to search for.
+            normalized_link: Normalized form of ``link`` to compare results with.
+            collection_id: Collection ID (0 for all collections).
+
+        Returns:
+            True if a matching raindrop was found.
+        """
+        self._wait_for_rate_limit()
+        response = self.api.get(
+            f"{API_BASE_URL}/raindrops/{collection_id}?search={quote(link, safe='')}&perpage=100"
         )
-        response = self.api.get(search_url)
         response.raise_for_status()
-        response_data = response.json()
+        response_data = orjson.loads(response.content)
         items = response_data.get("items", [])
         if not isinstance(items, list):
             return False
+        return any(
+            isinstance(item, dict)
+            and isinstance(item.get("link"), str)
+            and _normalize_link(item["link"]) == normalized_link
+            for item in items
+        )
 
-        for item in items:
-            if not isinstance(item, dict):
-                continue
-            item_link = item.get("link")
-            if not isinstance(item_link, str):
-                continue
-            if self._normalize_link(item_link) == normalized_link:
-                return True
-        return False
+    def _fetch_links_page(self, url: str, page: int) -> tuple[list[str], int, int | None]:
+        """Fetch one page of raindrops and extract their links.
 
-    def _normalize_link(self, link: str) -> str:
-        """Normalize links to avoid false negatives on trailing slashes."""
-        return link.strip().rstrip("/")
+        Args:
+            url: Collection raindrops URL.
+            page: Zero-based page number.
+
+        Returns:
+            Tuple of (normalized links, number of items on the page, total
+            item count reported by the API or None).
+        """
+        self._wait_for_rate_limit()
+        response = self.api.get(url, params={"page": page, "perpage": PREFETCH_PAGE_SIZE})
+        response.raise_for_status()
+        response_data = orjson.loads(response.content)
+        items = response_data.get("items", [])
+        if not isinstance(items, list):
+            return [], 0, None
+        total = response_data.get("count")
+        links = [
+            _normalize_link(item["link"])
+            for item in items
+            if isinstance(item, dict) and isinstance(item.get("link"), str)
+        ]
+        return links, len(items), total if isinstance(total, int) else None
+
+    def _remember_created_links(self, requests: list[RaindropCreateRequest]) -> None:
+        """Record freshly created links in the prefetched and searched links.
+
+        Args:
+            requests: Requests that were created successfully.
+        """
+        with self._link_cache_lock:
+            for request in requests:
+                normalized_link = _normalize_link(request.link)
+                for scope in (request.collection_id, 0):
+                    self._searched_links[(scope, normalized_link)] = True
+                    known = self._known_links.get(scope)
+                    if known is not None:
+                        known.add(normalized_link)
+
+
+def _normalize_link(link: str) -> str:
+    """Normalize links to avoid false negatives on cosmetic differences.
+
+    Lowercases scheme and host and strips trailing slashes. The fragment is
+    kept, since hash-routed apps use it to address distinct pages.
+
+    Args:
+        link: URL to normalize.
+
+    Returns:
+        Normalized link used for duplicate checks.
+    """
+    parts = urlsplit(link.strip())
+    return urlunsplit(
+        parts._replace(scheme=parts.scheme.lower(), netloc=parts.netloc.lower())
+    ).rstrip("/")
+
+
+@functools.lru_cache(maxsize=128)
+def _make_collection_ref(collection_id: int) -> CollectionRef:
+    """Build the shared collection reference for a collection ID.
+
+    Args:
+        collection_id: Collection ID.
+
+    Returns:
+        CollectionRef for the ID; special IDs map to the library's constants.
+    """
+    # Check for special collection IDs
+    if collection_id == -1:
+        return CollectionRef.Unsorted
+    if collection_id == -99:
+        return CollectionRef.Trash
+
+    # For regular collections, create a reference
+    # We use CollectionRef with the ID
+    return CollectionRef({"$id": collection_id})
 
 
 class MockRaindropClient:
@@ -431,10 +759,22 @@ class MockRaindropClient:
             RaindropCollection(id=12345, title="Test Collection", count=0),
             RaindropCollection(id=-1, title="Unsorted", count=0),
         ]
+        self._title_index: dict[str, RaindropCollection] = {}
+        for collection in self.collections:
+            self._title_index.setdefault(collection.title.casefold(), collection)
         self.created_raindrops: list[RaindropCreateRequest] = []
         self.batch_create_calls: list[list[RaindropCreateRequest]] = []
         self._next_id = 1
-        self.existing_links = {self._normalize_link(link) for link in existing_links or []}
+        self.expected_link_checks: int | None = None
+        self.existing_links = {_normalize_link(link) for link in existing_links or []}
+        self._created_links: set[str] = set()
+        # Sync creates chunks from worker threads; keep each batch's IDs contiguous
+        self._lock = threading.RLock()
+
+    @property
+    def created_links(self) -> Set[str]:
+        """Links of created raindrops, normalized as for duplicate checks."""
+        return self._created_links
 
     def list_collections(self) -> list[RaindropCollection]:
         """Return pre-configured collections."""
@@ -442,17 +782,15 @@ class MockRaindropClient:
 
     def get_collection_by_title(self, title: str) -> RaindropCollection | None:
         """Find collection by title."""
-        title_lower = title.lower()
-        for c in self.collections:
-            if c.title.lower() == title_lower:
-                return c
-        return None
+        return self._title_index.get(title.casefold())
 
     def create_raindrop(self, request: RaindropCreateRequest) -> CreatedRaindrop:
         """Track created raindrop."""
-        self.created_raindrops.append(request)
-        raindrop_id = self._next_id
-        self._next_id += 1
+        with self._lock:
+            self.created_raindrops.append(request)
+            self._created_links.add(_normalize_link(request.link))
+            raindrop_id = self._next_id
+            self._next_id += 1
         return CreatedRaindrop(
             id=raindrop_id,
             link=request.link,
@@ -462,17 +800,17 @@ class MockRaindropClient:
 
     def create_raindrops(self, requests: list[RaindropCreateRequest]) -> list[CreatedRaindrop]:
         """Track bulk-created raindrops in order."""
-        self.batch_create_calls.append(list(requests))
-        return [self.create_raindrop(request) for request in requests]
+        with self._lock:
+            self.batch_create_calls.append(list(requests))
+            return [self.create_raindrop(request) for request in requests]
+
+    def expect_link_checks(self, count: int, collection_id: int | None = None) -> None:
+        """Record the announced number of duplicate checks."""
+        del collection_id
+        self.expected_link_checks = count
 
     def check_link_exists(self, link: str, collection_id: int | None = None) -> bool:
         """Check if link was already created in this session."""
         del collection_id
-        normalized = self._normalize_link(link)
-        if normalized in self.existing_links:
-            return True
-        return any(self._normalize_link(r.link) == normalized for r in self.created_raindrops)
-
-    def _normalize_link(self, link: str) -> str:
-        """Normalize links for duplicate checks."""
-        return link.strip().rstrip("/")
+        normalized = _normalize_link(link)
+        return normalized in self.existing_links or normalized in self._created_links
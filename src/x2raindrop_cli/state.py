@@ -6,11 +6,16 @@ have already been synced, enabling idempotent sync operations.
 
 from __future__ import annotations
 
-import json
+import contextlib
+import dataclasses
+import os
+import tempfile
+from collections.abc import Iterable
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+import orjson
 import structlog
 
 from x2raindrop_cli.models import SyncedBookmark
@@ -35,7 +40,8 @@ class SyncState:
             path: Path to the state file.
         """
         self.path = path
-        self._synced: dict[str, SyncedBookmark] = {}
+        # Records stay in their on-disk dict form until first accessed
+        self._synced: dict[str, SyncedBookmark | dict[str, Any]] = {}
         self._dirty = False
 
     def load(self) -> None:
@@ -45,23 +51,21 @@ class SyncState:
             return
 
         try:
-            with open(self.path) as f:
-                data = json.load(f)
-
-            for tweet_id, record in data.get("synced", {}).items():
-                self._synced[tweet_id] = SyncedBookmark(
-                    tweet_id=record["tweet_id"],
-                    raindrop_links=record.get("raindrop_links", []),
-                    synced_at=datetime.fromisoformat(record["synced_at"]),
-                    deleted_from_x=record.get("deleted_from_x", False),
-                )
+            data = orjson.loads(self.path.read_bytes())
+
+            synced: dict[str, dict[str, Any]] = data.get("synced", {})
+            # Reject records of the wrong shape up front; timestamps are only
+            # parsed when `_get_record` converts a record.
+            for tweet_id, record in synced.items():
+                _validate_record(tweet_id, record)
+            self._synced.update(synced)
 
             logger.debug(
                 "Loaded state",
                 path=str(self.path),
                 synced_count=len(self._synced),
             )
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
+        except (OSError, ValueError, AttributeError, KeyError, TypeError) as e:
             logger.warning(
                 "Failed to load state, starting fresh",
                 path=str(self.path),
@@ -80,7 +84,9 @@ class SyncState:
             "version": 1,
             "last_updated": datetime.now().isoformat(),
             "synced": {
-                tweet_id: {
+                tweet_id: record
+                if isinstance(record, dict)
+                else {
                     "tweet_id": record.tweet_id,
                     "raindrop_links": record.raindrop_links,
                     "synced_at": record.synced_at.isoformat(),
@@ -90,8 +96,22 @@ class SyncState:
             },
         }
 
-        with open(self.path, "w") as f:
-            json.dump(data, f, indent=2)
+        # Write a uniquely named sibling temp file and swap it in, so a crash
+        # mid-write never leaves a truncated state file behind and concurrent
+        # runs never write to the same temp file.
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
+            raise
 
         self._dirty = False
         logger.debug("Saved state", path=str(self.path), synced_count=len(self._synced))
@@ -116,13 +136,46 @@ class SyncState:
         Returns:
             SyncedBookmark if found, None otherwise.
         """
-        return self._synced.get(tweet_id)
+        if tweet_id not in self._synced:
+            return None
+        return self._get_record(tweet_id)
+
+    def _get_record(self, tweet_id: str) -> SyncedBookmark:
+        """Get a sync record, converting it from its on-disk form if needed.
+
+        Args:
+            tweet_id: X tweet ID that is known to be synced.
+
+        Returns:
+            The SyncedBookmark record.
+        """
+        record = self._synced[tweet_id]
+        if isinstance(record, dict):
+            try:
+                synced_at = datetime.fromisoformat(record["synced_at"])
+            except ValueError:
+                # The tweet is still synced; only its sync time is unknown
+                logger.warning(
+                    "Invalid sync timestamp in state",
+                    tweet_id=tweet_id,
+                    synced_at=record["synced_at"],
+                )
+                synced_at = datetime.min
+            record = SyncedBookmark(
+                tweet_id=record["tweet_id"],
+                raindrop_links=record.get("raindrop_links", []),
+                synced_at=synced_at,
+                deleted_from_x=record.get("deleted_from_x", False),
+            )
+            self._synced[tweet_id] = record
+        return record
 
     def mark_synced(
         self,
         tweet_id: str,
         raindrop_links: list[str],
         deleted_from_x: bool = False,
+        synced_at: datetime | None = None,
     ) -> None:
         """Mark a tweet as synced.
 
@@ -130,14 +183,10 @@ class SyncState:
             tweet_id: X tweet ID.
             raindrop_links: URLs of created Raindrop items.
             deleted_from_x: Whether it was deleted from X.
+            synced_at: Sync timestamp to record; defaults to now. Callers
+                marking many tweets can pass one shared value.
         """
-        self._synced[tweet_id] = SyncedBookmark(
-            tweet_id=tweet_id,
-            raindrop_links=raindrop_links,
-            synced_at=datetime.now(),
-            deleted_from_x=deleted_from_x,
-        )
-        self._dirty = True
+        self.mark_synced_many([(tweet_id, raindrop_links, deleted_from_x)], synced_at)
         logger.debug(
             "Marked as synced",
             tweet_id=tweet_id,
@@ -145,21 +194,56 @@ class SyncState:
             deleted_from_x=deleted_from_x,
         )
 
+    def is_synced_many(self, tweet_ids: Iterable[str]) -> set[str]:
+        """Check which of several tweets have been synced.
+
+        Args:
+            tweet_ids: X tweet IDs to check.
+
+        Returns:
+            The subset of tweet IDs that are already synced.
+        """
+        return self._synced.keys() & set(tweet_ids)
+
+    def mark_synced_many(
+        self,
+        records: Iterable[tuple[str, list[str], bool]],
+        synced_at: datetime | None = None,
+    ) -> None:
+        """Mark several tweets as synced with a shared timestamp.
+
+        Args:
+            records: Tuples of (tweet ID, created Raindrop URLs, deleted from X).
+            synced_at: Sync timestamp to record; defaults to now.
+        """
+        synced_at_iso = (synced_at or datetime.now()).isoformat()
+        self._synced.update(
+            {
+                tweet_id: {
+                    "tweet_id": tweet_id,
+                    "raindrop_links": list(raindrop_links),
+                    "synced_at": synced_at_iso,
+                    "deleted_from_x": deleted_from_x,
+                }
+                for tweet_id, raindrop_links, deleted_from_x in records
+            }
+        )
+        self._dirty = True
+
     def mark_deleted(self, tweet_id: str) -> None:
         """Mark a synced tweet as deleted from X.
 
         Args:
             tweet_id: X tweet ID.
         """
-        if tweet_id in self._synced:
-            old_record = self._synced[tweet_id]
-            self._synced[tweet_id] = SyncedBookmark(
-                tweet_id=old_record.tweet_id,
-                raindrop_links=old_record.raindrop_links,
-                synced_at=old_record.synced_at,
-                deleted_from_x=True,
-            )
-            self._dirty = True
+        old_record = self._synced.get(tweet_id)
+        if old_record is None:
+            return
+        if isinstance(old_record, dict):
+            self._synced[tweet_id] = {**old_record, "deleted_from_x": True}
+        else:
+            self._synced[tweet_id] = dataclasses.replace(old_record, deleted_from_x=True)
+        self._dirty = True
 
     def get_all_synced(self) -> list[SyncedBookmark]:
         """Get all synced records.
@@ -167,7 +251,7 @@ class SyncState:
         Returns:
             List of all synced bookmarks.
         """
-        return list(self._synced.values())
+        return [self._get_record(tweet_id) for tweet_id in self._synced]
 
     def get_synced_count(self) -> int:
         """Get count of synced items.
@@ -183,6 +267,31 @@ class SyncState:
         self._dirty = True
 
 
+def _validate_record(tweet_id: str, record: Any) -> None:
+    """Check that an on-disk sync record has the shape of a SyncedBookmark.
+
+    Only types are checked; the timestamp is parsed lazily by `_get_record`.
+
+    Args:
+        tweet_id: Key the record is stored under.
+        record: Raw record from the state file.
+
+    Raises:
+        KeyError: If a required field is missing.
+        TypeError: If the record or one of its fields has the wrong type.
+    """
+    if not isinstance(record, dict):
+        raise TypeError(f"Sync record for {tweet_id} is not an object")
+    if "tweet_id" not in record or "synced_at" not in record:
+        raise KeyError(f"Incomplete sync record for {tweet_id}")
+    if not isinstance(record["tweet_id"], str) or not isinstance(record["synced_at"], str):
+        raise TypeError(f"Invalid sync record for {tweet_id}")
+    if not isinstance(record.get("raindrop_links", []), list) or not isinstance(
+        record.get("deleted_from_x", False), bool
+    ):
+        raise TypeError(f"Invalid sync record for {tweet_id}")
+
+
 class InMemoryState(SyncState):
     """In-memory state for testing (no file I/O)."""
 
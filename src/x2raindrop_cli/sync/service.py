@@ -7,7 +7,10 @@ and optional deletion from X.
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import itertools
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 import structlog
@@ -20,7 +23,12 @@ from x2raindrop_cli.models import (
     RaindropCreateRequest,
     SyncResult,
 )
-from x2raindrop_cli.raindrop.client import RaindropClientProtocol
+from x2raindrop_cli.raindrop.client import (
+    MAX_BATCH_CREATE_SIZE,
+    MAX_CONCURRENT_REQUESTS,
+    CreatedRaindrop,
+    RaindropClientProtocol,
+)
 from x2raindrop_cli.state import SyncState
 from x2raindrop_cli.x.client import XClientProtocol
 
@@ -98,19 +106,17 @@ def create_raindrop_requests(
     links = resolve_links(bookmark, settings.link_mode, settings.both_behavior)
     requests: list[RaindropCreateRequest] = []
 
-    for link, note in links:
-        # Build title
-        title = bookmark.get_title()
-
-        # Build excerpt (tweet text)
-        excerpt = bookmark.text
+    # Title and excerpt (tweet text) are shared by every link of the bookmark
+    title = bookmark.get_title()
+    excerpt = bookmark.text
 
+    for link, note in links:
         requests.append(
             RaindropCreateRequest(
                 link=link,
                 title=title,
                 excerpt=excerpt,
-                tags=list(settings.tags),
+                tags=tuple(settings.tags),
                 collection_id=settings.collection_id,
                 note=note,
                 source_tweet_id=bookmark.tweet_id,
@@ -120,6 +126,33 @@ def create_raindrop_requests(
     return requests
 
 
+def _chunk_pending_requests(
+    pending_bookmark_requests: list[tuple[int, BookmarkItem, list[RaindropCreateRequest]]],
+) -> Iterator[list[tuple[int, BookmarkItem, list[RaindropCreateRequest]]]]:
+    """Split pending bookmarks into chunks of at most `MAX_BATCH_CREATE_SIZE` requests.
+
+    A bookmark's requests always stay in the same chunk.
+
+    Args:
+        pending_bookmark_requests: Pending (index, bookmark, requests) entries.
+
+    Yields:
+        Consecutive chunks of pending entries.
+    """
+    chunk: list[tuple[int, BookmarkItem, list[RaindropCreateRequest]]] = []
+    request_count = 0
+    for entry in pending_bookmark_requests:
+        entry_requests = len(entry[2])
+        if chunk and request_count + entry_requests > MAX_BATCH_CREATE_SIZE:
+            yield chunk
+            chunk = []
+            request_count = 0
+        chunk.append(entry)
+        request_count += entry_requests
+    if chunk:
+        yield chunk
+
+
 class SyncService:
     """Orchestrates syncing X bookmarks to Raindrop.io.
 
@@ -180,6 +213,13 @@ class SyncService:
 
         pending_bookmark_requests: list[tuple[int, BookmarkItem, list[RaindropCreateRequest]]] = []
         checked_link_cache: dict[tuple[int, str], bool] = {}
+        already_synced_ids = self.state.is_synced_many(b.tweet_id for b in bookmarks)
+        if self.settings.skip_existing_links:
+            # Every unsynced bookmark yields at least one link to check
+            self.raindrop_client.expect_link_checks(
+                len(bookmarks) - len(already_synced_ids),
+                collection_id=self.settings.collection_id,
+            )
 
         # Build request payloads for each bookmark
         for idx, bookmark in enumerate(bookmarks):
@@ -189,7 +229,7 @@ class SyncService:
             )
 
             # Check if already synced
-            if self.state.is_synced(bookmark.tweet_id):
+            if bookmark.tweet_id in already_synced_ids:
                 log.debug("Skipping already synced bookmark")
                 result.already_synced += 1
                 if progress_callback:
@@ -293,20 +333,57 @@ class SyncService:
         result: SyncResult,
         progress_callback: ProgressCallback | None,
     ) -> None:
-        """Create pending Raindrop requests in batch, with fallback mode."""
-        if not pending_bookmark_requests:
-            return
+        """Create pending Raindrop requests chunk by chunk.
+
+        Each chunk holds up to `MAX_BATCH_CREATE_SIZE` requests, and up to
+        `MAX_CONCURRENT_REQUESTS` chunks are created concurrently. Chunks are
+        then recorded (and deleted from X, if enabled) in order, each as soon
+        as its raindrops are created, so an interrupted run keeps the progress
+        of finished chunks.
+        """
+        chunks = _chunk_pending_requests(pending_bookmark_requests)
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            in_flight = deque(
+                (chunk, executor.submit(self._create_pending_chunk, chunk))
+                for chunk in itertools.islice(chunks, MAX_CONCURRENT_REQUESTS)
+            )
+            while in_flight:
+                chunk, future = in_flight.popleft()
+                # Keep the pool busy while this chunk is recorded
+                for next_chunk in itertools.islice(chunks, 1):
+                    in_flight.append(
+                        (next_chunk, executor.submit(self._create_pending_chunk, next_chunk))
+                    )
+                self._sync_pending_chunk(chunk, future, result, progress_callback)
 
+    def _create_pending_chunk(
+        self,
+        pending_bookmark_requests: list[tuple[int, BookmarkItem, list[RaindropCreateRequest]]],
+    ) -> list[CreatedRaindrop]:
+        """Create one chunk of pending Raindrop requests with a bulk create.
+
+        Runs on a worker thread; only touches the Raindrop client.
+        """
         all_requests: list[RaindropCreateRequest] = [
             request
             for _, _, bookmark_requests in pending_bookmark_requests
             for request in bookmark_requests
         ]
+        created_raindrops = self.raindrop_client.create_raindrops(all_requests)
+        if len(created_raindrops) != len(all_requests):
+            raise ValueError("Batch create returned a different number of items than requested")
+        return created_raindrops
 
+    def _sync_pending_chunk(
+        self,
+        pending_bookmark_requests: list[tuple[int, BookmarkItem, list[RaindropCreateRequest]]],
+        created: Future[list[CreatedRaindrop]],
+        result: SyncResult,
+        progress_callback: ProgressCallback | None,
+    ) -> None:
+        """Record one chunk's bulk create, with fallback mode if it failed."""
         try:
-            created_raindrops = self.raindrop_client.create_raindrops(all_requests)
-            if len(created_raindrops) != len(all_requests):
-                raise ValueError("Batch create returned a different number of items than requested")
+            created_raindrops = created.result()
             self._finalize_batched_sync(
                 pending_bookmark_requests=pending_bookmark_requests,
                 created_links=[raindrop.link for raindrop in created_raindrops],
@@ -332,18 +409,13 @@ class SyncService:
         progress_callback: ProgressCallback | None,
     ) -> None:
         """Update state/results after a successful batched create."""
+        synced_bookmarks: list[tuple[int, BookmarkItem, list[str]]] = []
         cursor = 0
         for idx, bookmark, bookmark_requests in pending_bookmark_requests:
             request_count = len(bookmark_requests)
-            bookmark_links = created_links[cursor : cursor + request_count]
+            synced_bookmarks.append((idx, bookmark, created_links[cursor : cursor + request_count]))
             cursor += request_count
-            self._mark_bookmark_synced(
-                idx=idx,
-                bookmark=bookmark,
-                created_links=bookmark_links,
-                result=result,
-                progress_callback=progress_callback,
-            )
+        self._mark_bookmarks_synced(synced_bookmarks, result, progress_callback)
 
     def _sync_pending_bookmarks_individually(
         self,
@@ -352,6 +424,7 @@ class SyncService:
         progress_callback: ProgressCallback | None,
     ) -> None:
         """Fallback mode when bulk create fails."""
+        synced_bookmarks: list[tuple[int, BookmarkItem, list[str]]] = []
         for idx, bookmark, bookmark_requests in pending_bookmark_requests:
             log = logger.bind(
                 tweet_id=bookmark.tweet_id,
@@ -376,10 +449,51 @@ class SyncService:
                 result.failed += 1
                 continue
 
+            synced_bookmarks.append((idx, bookmark, created_links))
+
+        self._mark_bookmarks_synced(synced_bookmarks, result, progress_callback)
+
+    def _mark_bookmarks_synced(
+        self,
+        synced_bookmarks: list[tuple[int, BookmarkItem, list[str]]],
+        result: SyncResult,
+        progress_callback: ProgressCallback | None,
+    ) -> None:
+        """Record synced bookmarks in state and delete them from X (if enabled).
+
+        The records are saved before deleting, so bookmarks still pending
+        deletion when a run is interrupted are on disk as synced but not
+        deleted from X.
+        """
+        if not synced_bookmarks:
+            return
+
+        self.state.mark_synced_many(
+            (bookmark.tweet_id, created_links, False)
+            for _, bookmark, created_links in synced_bookmarks
+        )
+
+        delete_errors: dict[str, str | None] = {}
+        if self.settings.remove_from_x:
+            self.state.save()
+            tweet_ids = [bookmark.tweet_id for _, bookmark, _ in synced_bookmarks]
+            try:
+                delete_errors = self.x_client.delete_bookmarks(tweet_ids)
+            except Exception as error:
+                logger.warning("Failed to delete from X", error=str(error))
+                result.add_errors(
+                    f"[{tweet_id}] Failed to delete from X: {error}" for tweet_id in tweet_ids
+                )
+            for tweet_id, delete_error in delete_errors.items():
+                if delete_error is None:
+                    self.state.mark_deleted(tweet_id)
+
+        for idx, bookmark, _ in synced_bookmarks:
             self._mark_bookmark_synced(
                 idx=idx,
                 bookmark=bookmark,
-                created_links=created_links,
+                attempted_delete=bookmark.tweet_id in delete_errors,
+                delete_error=delete_errors.get(bookmark.tweet_id),
                 result=result,
                 progress_callback=progress_callback,
             )
@@ -388,31 +502,28 @@ class SyncService:
         self,
         idx: int,
         bookmark: BookmarkItem,
-        created_links: list[str],
+        attempted_delete: bool,
+        delete_error: str | None,
         result: SyncResult,
         progress_callback: ProgressCallback | None,
     ) -> None:
-        """Mark a bookmark as synced and handle optional X deletion."""
+        """Report a bookmark recorded as synced and the outcome of its X deletion.
+
+        ``attempted_delete`` is False when no deletion result is available
+        (removal disabled, or the whole deletion call failed and was already
+        reported).
+        """
         log = logger.bind(
             tweet_id=bookmark.tweet_id,
             progress=f"{idx + 1}/{result.total_bookmarks}",
         )
-        deleted_from_x = False
-        if self.settings.remove_from_x:
-            try:
-                self.x_client.delete_bookmark(bookmark.tweet_id)
-                deleted_from_x = True
-                result.deleted_from_x += 1
-                log.info("Deleted from X bookmarks")
-            except Exception as error:
-                log.warning("Failed to delete from X", error=str(error))
-                result.add_error(f"[{bookmark.tweet_id}] Failed to delete from X: {error}")
+        if attempted_delete and delete_error is None:
+            result.deleted_from_x += 1
+            log.info("Deleted from X bookmarks")
+        elif attempted_delete:
+            log.warning("Failed to delete from X", error=delete_error)
+            result.add_error(f"[{bookmark.tweet_id}] Failed to delete from X: {delete_error}")
 
-        self.state.mark_synced(
-            bookmark.tweet_id,
-            created_links,
-            deleted_from_x,
-        )
         result.newly_synced += 1
         if progress_callback:
             progress_callback(
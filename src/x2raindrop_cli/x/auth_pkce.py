@@ -9,7 +9,6 @@ from __future__ import annotations
 import base64
 import hashlib
 import http.server
-import json
 import secrets
 import socketserver
 import threading
@@ -22,6 +21,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import httpx
+import orjson
 import structlog
 
 if TYPE_CHECKING:
@@ -314,8 +314,7 @@ def save_token(token: OAuth2Token, path: Path) -> None:
         path: Path to save the token to.
     """
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w") as f:
-        json.dump(token.to_dict(), f, indent=2)
+    path.write_bytes(orjson.dumps(token.to_dict(), option=orjson.OPT_INDENT_2))
     logger.debug("Token saved", path=str(path))
 
 
@@ -332,10 +331,9 @@ def load_token(path: Path) -> OAuth2Token | None:
         return None
 
     try:
-        with open(path) as f:
-            data = json.load(f)
+        data = orjson.loads(path.read_bytes())
         return OAuth2Token.from_dict(data)
-    except (json.JSONDecodeError, KeyError, ValueError) as e:
+    except (orjson.JSONDecodeError, KeyError, ValueError) as e:
         logger.warning("Failed to load token", path=str(path), error=str(e))
         return None
 
@@ -7,28 +7,74 @@ keeping the app-specific `BookmarkItem` parsing and request tracking behavior.
 from __future__ import annotations
 
 import contextlib
+import functools
+import logging
 import re
-from collections.abc import Iterator
+import time
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, Protocol
+from urllib.parse import urlsplit
 
+import requests
 import structlog
+from requests.adapters import HTTPAdapter
 from xdk import Client as XdkClient
 
 from x2raindrop_cli.models import BookmarkItem
 from x2raindrop_cli.x.auth_pkce import OAuth2Token, refresh_access_token
+from x2raindrop_cli.x.http_cache import ConditionalCacheAdapter
 
 if TYPE_CHECKING:
     pass
 
 logger = structlog.get_logger(__name__)
+# stdlib logger behind `logger`; used to skip building debug events on hot paths
+_stdlib_logger = logging.getLogger(__name__)
 
-# URL pattern for extracting external URLs (non-t.co links)
-URL_PATTERN = re.compile(r"https?://(?!t\.co)[^\s]+")
+# Host part of links pointing back to X itself (or its t.co shortener),
+# including subdomains such as mobile.twitter.com; anchored on the host so
+# e.g. "project.com" is not mistaken for "t.co"
+_X_HOST = r"(?:[^/?#\s]*\.)?(?:t\.co|twitter\.com|x\.com)(?::\d+)?(?=[/?#\s]|$)"
+
+# URL pattern for extracting external URLs from text (X-hosted links excluded)
+URL_PATTERN = re.compile(rf"https?://(?!{_X_HOST})[^\s]+", re.IGNORECASE)
+
+# Matches URLs whose host is X itself
+X_HOST_PATTERN = re.compile(rf"https?://{_X_HOST}", re.IGNORECASE)
+
+# Numeric ID path segments; X rate limits apply per route, not per resource ID
+_ID_SEGMENT_PATTERN = re.compile(r"/\d+(?=/|$)")
 
 # Maximum results per page (X API limit)
 MAX_RESULTS_PER_PAGE = 100
 
+# Expansions and fields requested for every bookmarks page (read-only, shared)
+BOOKMARK_QUERY_FIELDS: Mapping[str, Any] = MappingProxyType(
+    {
+        "expansions": ("author_id",),
+        "tweet_fields": ("created_at", "text", "entities", "author_id"),
+        "user_fields": ("username", "name"),
+    }
+)
+
+# Default number of concurrent bookmark deletions
+DEFAULT_DELETE_CONCURRENCY = 5
+
+# Reported for a deletion the API answered without confirming the removal
+DELETE_NOT_CONFIRMED_ERROR = "X did not confirm the removal"
+
+# Rate-limit waits: safety margin after the reset time, and an upper bound
+# (one 15-minute window) so a bogus reset header cannot stall the sync
+RATE_LIMIT_WAIT_BUFFER_SECONDS = 5.0
+MAX_RATE_LIMIT_WAIT_SECONDS = 15 * 60.0
+
+# Connections in the shared pool; also caps delete concurrency
+MAX_POOL_CONNECTIONS = 10
+
 
 class XClientProtocol(Protocol):
     """Protocol for X client implementations (for testing)."""
@@ -55,6 +101,23 @@ class XClientProtocol(Protocol):
         """
         ...
 
+    def delete_bookmarks(
+        self,
+        tweet_ids: Iterable[str],
+        concurrency: int = DEFAULT_DELETE_CONCURRENCY,
+    ) -> dict[str, str | None]:
+        """Remove several bookmarks from X.
+
+        Args:
+            tweet_ids: IDs of the tweets to unbookmark.
+            concurrency: Maximum number of deletions in flight.
+
+        Returns:
+            Mapping of tweet ID to None if it was removed, or to the reason
+            the removal failed.
+        """
+        ...
+
     def get_authenticated_user_id(self) -> str:
         """Get the authenticated user's ID.
 
@@ -68,15 +131,29 @@ class XClient:
     """Client for interacting with X API bookmarks.
 
     Uses the official Python XDK client for all API operations and tracks the
-    number of API calls performed in this process for visibility.
+    number of API calls performed in this process for visibility. When a cache
+    directory is configured, GET responses go through `ConditionalCacheAdapter`.
     """
 
+    __slots__ = (
+        "token",
+        "_refresh_client_id",
+        "_refresh_client_secret",
+        "_cache_dir",
+        "_user_id",
+        "_request_count",
+        "_rate_limit_remaining",
+        "_rate_limit_reset_at",
+        "_x_client",
+    )
+
     def __init__(
         self,
         token: OAuth2Token,
         *,
         refresh_client_id: str | None = None,
         refresh_client_secret: str | None = None,
+        cache_dir: Path | None = None,
     ) -> None:
         """Initialize the client with an OAuth2 token.
 
@@ -84,13 +161,19 @@ class XClient:
             token: OAuth2 token for authentication.
             refresh_client_id: OAuth2 client ID used to refresh access tokens (optional).
             refresh_client_secret: OAuth2 client secret used to refresh access tokens (optional).
+            cache_dir: Directory for the conditional GET response cache (optional).
         """
         self.token = token
         self._refresh_client_id = refresh_client_id
         self._refresh_client_secret = refresh_client_secret
+        self._cache_dir = cache_dir
         self._user_id: str | None = None
         self._request_count: int = 0
-        self._x_client = XdkClient(access_token=token.access_token)
+        # Rate-limit budget per (method, route) key, see `_rate_limit_route`
+        self._rate_limit_remaining: dict[tuple[str, str], int] = {}
+        # Monotonic-clock deadline at which each route's rate-limit window resets
+        self._rate_limit_reset_at: dict[tuple[str, str], float] = {}
+        self._x_client = self._create_xdk_client()
 
         # Best-effort early refresh if token is already expired.
         self._ensure_fresh_token()
@@ -109,8 +192,87 @@ class XClient:
         self.close()
 
     def close(self) -> None:
-        """Close the underlying XDK session."""
-        self._x_client.session.close()
+        """Close the underlying XDK session, keeping the shared HTTPS adapter open."""
+        session = self._x_client.session
+        session.adapters.pop("https://", None)
+        session.close()
+
+    def _create_xdk_client(self) -> XdkClient:
+        """Create an XDK client for the current access token.
+
+        Returns:
+            XDK client with the response cache mounted when configured.
+        """
+        client = XdkClient(access_token=self.token.access_token)
+        client.session.hooks["response"].append(self._record_rate_limit)
+        client.session.mount("https://", _shared_https_adapter(self._cache_dir))
+        return client
+
+    def _record_rate_limit(self, response: requests.Response, *_args: Any, **_kwargs: Any) -> None:
+        """Track the rate-limit budget reported by the X API for the request's route.
+
+        Registered as a ``requests`` response hook on the XDK session.
+
+        Args:
+            response: HTTP response received from the X API.
+            *_args: Unused hook arguments.
+            **_kwargs: Unused hook arguments.
+        """
+        request = response.request
+        if request is None or request.method is None or request.url is None:
+            return
+        route = _rate_limit_route(request.method, request.url)
+        remaining = response.headers.get("x-rate-limit-remaining")
+        reset = response.headers.get("x-rate-limit-reset")
+        with contextlib.suppress(ValueError):
+            if remaining is not None:
+                self._rate_limit_remaining[route] = int(remaining)
+            if reset is not None:
+                # The header is a wall-clock epoch; convert it to a monotonic
+                # deadline right away so later clock jumps don't skew the wait.
+                self._rate_limit_reset_at[route] = time.monotonic() + (float(reset) - time.time())
+
+    def _wait_for_rate_limit(self, route: tuple[str, str]) -> None:
+        """Sleep until a route's rate-limit window resets if its budget is exhausted.
+
+        Called before issuing requests so an exhausted window costs a wait
+        instead of a rejected (429) request.
+
+        Args:
+            route: Rate-limit key of the upcoming request (see `_rate_limit_route`).
+        """
+        if self._rate_limit_remaining.get(route) != 0:
+            return
+        reset_at = self._rate_limit_reset_at.get(route)
+        if reset_at is None or reset_at <= time.monotonic():
+            # Window already reset (or reset time unknown); budget is stale.
+            self._rate_limit_remaining.pop(route, None)
+            return
+
+        wait = self._get_rate_limit_wait_time(route)
+        logger.warning(
+            "X rate limit exhausted; waiting for reset",
+            route=" ".join(route),
+            wait_seconds=round(wait),
+        )
+        time.sleep(wait)
+        self._rate_limit_remaining.pop(route, None)
+
+    def _get_rate_limit_wait_time(self, route: tuple[str, str]) -> float:
+        """Get the number of seconds until a route's rate-limit window resets.
+
+        Args:
+            route: Rate-limit key (see `_rate_limit_route`).
+
+        Returns:
+            Seconds to wait (including a safety buffer), clamped to
+            `MAX_RATE_LIMIT_WAIT_SECONDS`; 0.0 if no reset time is known.
+        """
+        reset_at = self._rate_limit_reset_at.get(route)
+        if reset_at is None:
+            return 0.0
+        wait = reset_at - time.monotonic()
+        return min(max(0.0, wait) + RATE_LIMIT_WAIT_BUFFER_SECONDS, MAX_RATE_LIMIT_WAIT_SECONDS)
 
     def _ensure_fresh_token(self) -> None:
         """Refresh the access token if expired and refresh is configured."""
@@ -137,8 +299,8 @@ class XClient:
         # Swap token + underlying client so future calls use the fresh access token.
         self.token = refreshed
         with contextlib.suppress(Exception):
-            self._x_client.session.close()
-        self._x_client = XdkClient(access_token=self.token.access_token)
+            self.close()
+        self._x_client = self._create_xdk_client()
         logger.info("Access token refreshed for XDK client")
 
     def get_authenticated_user_id(self) -> str:
@@ -151,6 +313,7 @@ class XClient:
             return self._user_id
 
         self._ensure_fresh_token()
+        self._wait_for_rate_limit(_rate_limit_route("GET", "/2/users/me"))
         self._request_count += 1
         response = self._x_client.users.get_me()
         self._user_id = self._extract_id_from_me_response(response)
@@ -183,37 +346,32 @@ class XClient:
         user_id = self.get_authenticated_user_id()
         total_fetched = 0
         page_count = 0
+        # Don't ask for a full page when the caller only wants a few bookmarks.
+        # The SDK reuses this page size for every page it fetches.
+        page_size = min(MAX_RESULTS_PER_PAGE, max_results) if max_results else MAX_RESULTS_PER_PAGE
+        route = _rate_limit_route("GET", f"/2/users/{user_id}/bookmarks")
+        self._wait_for_rate_limit(route)
         for page in self._x_client.users.get_bookmarks(
             id=user_id,
-            max_results=MAX_RESULTS_PER_PAGE,
-            expansions=["author_id"],
-            tweet_fields=["created_at", "text", "entities", "author_id"],
-            user_fields=["username", "name"],
+            max_results=page_size,
+            **BOOKMARK_QUERY_FIELDS,
         ):
             page_count += 1
             self._request_count += 1
-            logger.debug("Fetching bookmarks page", page=page_count)
-            data = self._model_to_dict(page)
-
-            # Build user lookup for author info
-            users_lookup: dict[str, dict[str, str]] = {}
-            includes = data.get("includes", {})
-            include_users = includes.get("users", []) if isinstance(includes, dict) else []
-            for user in include_users:
-                if not isinstance(user, dict):
-                    continue
-                user_id_raw = user.get("id")
-                if user_id_raw is None:
-                    continue
-                users_lookup[str(user_id_raw)] = {
-                    "username": str(user.get("username", "")),
-                    "name": str(user.get("name", "")),
-                }
-
-            # Process tweets
-            tweets = data.get("data", [])
-            if not isinstance(tweets, list):
-                tweets = []
+            if _stdlib_logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Fetching bookmarks page", page=page_count)
+
+            # Build user lookup for author info: user ID -> (username, name)
+            includes = page.includes
+            include_users = includes.users if includes is not None and includes.users else ()
+            users_lookup: dict[str, tuple[str, str]] = {
+                str(user.id): (str(user.username), str(user.name)) for user in include_users
+            }
+
+            # Process tweets. Each tweet model is converted on its own right
+            # before it is yielded, so only one tweet dict is alive at a time
+            # instead of a dump of the whole page.
+            tweets = page.data
             if not tweets:
                 logger.info(
                     "No bookmarks found or end of results",
@@ -222,8 +380,9 @@ class XClient:
                 )
                 break
 
-            for tweet in tweets:
-                if not isinstance(tweet, dict):
+            for tweet_model in tweets:
+                tweet = self._model_to_dict(tweet_model)
+                if "id" not in tweet:
                     continue
                 bookmark = self._parse_tweet(tweet, users_lookup)
                 yield bookmark
@@ -237,6 +396,10 @@ class XClient:
                     )
                     return
 
+            # The SDK requests the next page as soon as we advance the iterator
+            if page.meta is not None and page.meta.next_token:
+                self._wait_for_rate_limit(route)
+
         logger.info(
             "Fetched all bookmarks",
             total=total_fetched,
@@ -245,11 +408,16 @@ class XClient:
         )
 
     def _model_to_dict(self, model: Any) -> dict[str, Any]:
-        """Convert an XDK response model into a dictionary."""
+        """Convert an XDK response model into a dictionary.
+
+        Unset optional fields are dropped: XDK models declare dozens of optional
+        fields per tweet, so this keeps the per-page dicts small and lets callers
+        rely on ``.get`` defaults instead of handling explicit ``None`` values.
+        """
         if isinstance(model, dict):
             return model
         if hasattr(model, "model_dump"):
-            dumped = model.model_dump()
+            dumped = model.model_dump(exclude_none=True)
             if isinstance(dumped, dict):
                 return dumped
         return {}
@@ -268,13 +436,13 @@ class XClient:
         raise ValueError("X get_me response does not contain a user ID")
 
     def _parse_tweet(
-        self, tweet: dict[str, Any], users_lookup: dict[str, dict[str, str]]
+        self, tweet: dict[str, Any], users_lookup: dict[str, tuple[str, str]]
     ) -> BookmarkItem:
         """Parse a tweet dict into a BookmarkItem.
 
         Args:
             tweet: Tweet data from API.
-            users_lookup: Mapping of user IDs to user info.
+            users_lookup: Mapping of user IDs to (username, name).
 
         Returns:
             BookmarkItem instance.
@@ -286,16 +454,16 @@ class XClient:
         # Get author info
         author_username: str | None = None
         author_name: str | None = None
-        if author_id and author_id in users_lookup:
-            author_username = users_lookup[author_id].get("username")
-            author_name = users_lookup[author_id].get("name")
+        if author_id and (author := users_lookup.get(author_id)):
+            author_username, author_name = author
 
         # Parse created_at
         created_at: datetime | None = None
         if created_str := tweet.get("created_at"):
             with contextlib.suppress(ValueError):
-                # X API returns ISO format with Z suffix
-                created_at = datetime.fromisoformat(created_str.replace("Z", "+00:00"))
+                # X API returns ISO format with Z suffix, which fromisoformat
+                # accepts natively on the supported Python versions (3.11+)
+                created_at = datetime.fromisoformat(created_str)
 
         # Build permalink
         if author_username:
@@ -326,30 +494,23 @@ class XClient:
             List of external URLs.
         """
         external_urls: list[str] = []
-        entities = tweet.get("entities", {})
+        entities = tweet.get("entities") or {}
 
         # URLs from entities (preferred, has expanded URLs)
-        if "urls" in entities:
-            for url_entity in entities["urls"]:
-                # Use expanded_url if available, otherwise unwrapped_url
-                expanded = url_entity.get("expanded_url") or url_entity.get("unwrapped_url")
-                # Filter out t.co and X/Twitter internal URLs
-                if (
-                    expanded
-                    and not expanded.startswith("https://t.co")
-                    and not any(domain in expanded for domain in ["twitter.com", "x.com", "t.co"])
-                ):
-                    external_urls.append(expanded)
+        append = external_urls.append
+        is_x_link = X_HOST_PATTERN.match
+        for url_entity in entities.get("urls", ()):
+            get = url_entity.get
+            # Use expanded_url if available, otherwise unwrapped_url
+            expanded = get("expanded_url") or get("unwrapped_url")
+            # Filter out t.co and X/Twitter internal URLs
+            if expanded and not is_x_link(expanded):
+                append(expanded)
 
         # Fallback: extract from text if no entity URLs
         if not external_urls:
-            text = tweet.get("text", "")
-            matches = URL_PATTERN.findall(text)
-            external_urls = [
-                url
-                for url in matches
-                if not any(domain in url for domain in ["twitter.com", "x.com"])
-            ]
+            # URL_PATTERN already rejects X-hosted links, so no filter pass
+            external_urls = URL_PATTERN.findall(tweet.get("text", ""))
 
         return external_urls
 
@@ -364,6 +525,9 @@ class XClient:
         """
         self._ensure_fresh_token()
         user_id = self.get_authenticated_user_id()
+        self._wait_for_rate_limit(
+            _rate_limit_route("DELETE", f"/2/users/{user_id}/bookmarks/{tweet_id}")
+        )
         self._request_count += 1
 
         logger.warning(
@@ -372,13 +536,101 @@ class XClient:
             total_requests=self._request_count,
         )
 
+        return self._delete_bookmark(user_id, tweet_id)
+
+    def delete_bookmarks(
+        self,
+        tweet_ids: Iterable[str],
+        concurrency: int = DEFAULT_DELETE_CONCURRENCY,
+    ) -> dict[str, str | None]:
+        """Remove several tweets from bookmarks concurrently.
+
+        The first deletion is sent on its own to learn the delete endpoint's
+        rate-limit budget; budgets of other endpoints (such as the bookmarks
+        GET) neither delay it nor size the waves. The rest are issued in waves
+        of at most ``concurrency`` requests, each further capped by the
+        ``x-rate-limit-remaining`` budget reported by previous delete
+        responses, and an exhausted delete budget waits for the window to
+        reset, so the client does not knowingly fire more requests than the
+        current window allows.
+
+        Args:
+            tweet_ids: IDs of the tweets to unbookmark.
+            concurrency: Maximum number of deletions in flight (capped at
+                `MAX_POOL_CONNECTIONS`).
+
+        Returns:
+            Mapping of tweet ID to None if it was removed, or to the reason the
+            removal failed. Failed requests are logged and do not stop the rest.
+        """
+        pending = list(dict.fromkeys(tweet_ids))
+        if not pending:
+            return {}
+
+        self._ensure_fresh_token()
+        # Resolve the user once for the whole batch; every request below only
+        # varies by tweet ID, so they all share one rate-limit route.
+        user_id = self.get_authenticated_user_id()
+        delete = functools.partial(self._delete_bookmark, user_id)
+        route = _rate_limit_route("DELETE", f"/2/users/{user_id}/bookmarks/{pending[0]}")
+        results: dict[str, str | None] = {}
+        concurrency = max(1, min(concurrency, MAX_POOL_CONNECTIONS))
+        cursor = 0
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            while cursor < len(pending):
+                self._wait_for_rate_limit(route)
+                remaining = self._rate_limit_remaining.get(route)
+                if cursor == 0:
+                    # Send one deletion alone first: its response headers
+                    # report the budget of the delete endpoint
+                    wave_size = 1
+                elif remaining is not None:
+                    wave_size = max(1, min(concurrency, remaining))
+                else:
+                    wave_size = concurrency
+                wave = pending[cursor : cursor + wave_size]
+                cursor += len(wave)
+                self._request_count += len(wave)
+
+                logger.warning(
+                    "Deleting bookmarks (uses 1 API request each)",
+                    count=len(wave),
+                    remaining=len(pending) - cursor,
+                    total_requests=self._request_count,
+                )
+
+                futures = {tweet_id: executor.submit(delete, tweet_id) for tweet_id in wave}
+                for tweet_id, future in futures.items():
+                    try:
+                        removed = future.result()
+                    except Exception as e:
+                        logger.warning("Failed to delete bookmark", tweet_id=tweet_id, error=str(e))
+                        results[tweet_id] = str(e)
+                    else:
+                        results[tweet_id] = None if removed else DELETE_NOT_CONFIRMED_ERROR
+
+        return results
+
+    def _delete_bookmark(self, user_id: str, tweet_id: str) -> bool:
+        """Issue a single bookmark deletion request.
+
+        Args:
+            user_id: Authenticated user's ID.
+            tweet_id: ID of the tweet to unbookmark.
+
+        Returns:
+            True if the API confirmed the removal.
+        """
         response = self._x_client.users.delete_bookmark(id=user_id, tweet_id=tweet_id)
-        response_data = self._model_to_dict(response)
-        data = response_data.get("data", {})
-        success = isinstance(data, dict) and data.get("bookmarked") is False
+        # The SDK has already validated the body; read the flag off the model
+        # instead of dumping it back into a dict.
+        data = response.data
+        success = data is not None and data.bookmarked is False
 
         if success:
-            logger.debug("Deleted bookmark", tweet_id=tweet_id)
+            if _stdlib_logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Deleted bookmark", tweet_id=tweet_id)
         else:
             logger.warning(
                 "Delete bookmark returned unexpected response",
@@ -389,6 +641,48 @@ class XClient:
         return success
 
 
+def _rate_limit_route(method: str, url: str) -> tuple[str, str]:
+    """Get the rate-limit key of an X API request.
+
+    X enforces rate limits per endpoint, so requests are keyed by method and
+    route template, with numeric IDs in the path replaced by a placeholder.
+
+    Args:
+        method: HTTP method of the request.
+        url: Request URL or path.
+
+    Returns:
+        Tuple of (method, route), e.g. ("DELETE", "/2/users/:id/bookmarks/:id").
+    """
+    return method.upper(), _ID_SEGMENT_PATTERN.sub("/:id", urlsplit(url).path)
+
+
+@functools.cache
+def _shared_https_adapter(cache_dir: Path | None) -> HTTPAdapter:
+    """Get the process-wide HTTPS adapter for X API sessions.
+
+    Every `XClient` mounts the same adapter (one per cache directory), so
+    clients created later in the process, or after a token refresh, reuse the
+    pooled TCP/TLS connections instead of handshaking again. Authorization is
+    set per session, so sharing the pool is safe; `XClient.close` detaches the
+    adapter before closing its session so the pool stays open. All calls go to
+    a single host, so one pool sized for concurrent deletes is enough.
+
+    Args:
+        cache_dir: Directory for the conditional GET response cache, or None.
+
+    Returns:
+        Shared adapter with a single-host pool sized for concurrent deletes.
+    """
+    pool_options: dict[str, Any] = {
+        "pool_connections": 1,
+        "pool_maxsize": MAX_POOL_CONNECTIONS,
+    }
+    if cache_dir is not None:
+        return ConditionalCacheAdapter(cache_dir, **pool_options)
+    return HTTPAdapter(**pool_options)
+
+
 class MockXClient:
     """Mock X client for testing.
 
@@ -396,6 +690,8 @@ class MockXClient:
     and tracks delete calls for verification.
     """
 
+    __slots__ = ("bookmarks", "user_id", "deleted_tweet_ids")
+
     def __init__(
         self,
         bookmarks: list[BookmarkItem] | None = None,
@@ -409,7 +705,7 @@ class MockXClient:
         """
         self.bookmarks = bookmarks or []
         self.user_id = user_id
-        self.deleted_tweet_ids: list[str] = []
+        self.deleted_tweet_ids: set[str] = set()
 
     def get_authenticated_user_id(self) -> str:
         """Get the mock user ID."""
@@ -424,5 +720,22 @@ class MockXClient:
 
     def delete_bookmark(self, tweet_id: str) -> bool:
         """Track deleted bookmark."""
-        self.deleted_tweet_ids.append(tweet_id)
+        self.deleted_tweet_ids.add(tweet_id)
         return True
+
+    def delete_bookmarks(
+        self,
+        tweet_ids: Iterable[str],
+        concurrency: int = DEFAULT_DELETE_CONCURRENCY,
+    ) -> dict[str, str | None]:
+        """Track deleted bookmarks."""
+        del concurrency
+        results: dict[str, str | None] = {}
+        for tweet_id in tweet_ids:
+            try:
+                removed = self.delete_bookmark(tweet_id)
+            except Exception as e:
+                results[tweet_id] = str(e)
+            else:
+                results[tweet_id] = None if removed else DELETE_NOT_CONFIRMED_ERROR
+        return results
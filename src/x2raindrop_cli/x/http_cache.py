@@ -0,0 +1,273 @@
+"""On-disk conditional GET cache.
+
+GET responses that carry validators (``ETag``/``Last-Modified``) are stored on
+disk and revalidated on the next run, so unchanged bookmark pages are answered
+with ``304 Not Modified`` and replayed from the cache instead of being
+downloaded again. Entries unused for `CACHE_MAX_AGE_SECONDS` are pruned, so
+pages addressed by expired pagination tokens do not accumulate forever.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+import orjson
+import structlog
+from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+logger = structlog.get_logger(__name__)
+# stdlib logger behind `logger`; used to skip building debug events on hot paths
+_stdlib_logger = logging.getLogger(__name__)
+
+# Headers that describe the wire encoding rather than the cached (decoded) body.
+_DROPPED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+# Entries not stored or revalidated for this long are deleted (30 days)
+CACHE_MAX_AGE_SECONDS = 30 * 24 * 60 * 60.0
+
+
+class ConditionalCacheAdapter(HTTPAdapter):
+    """HTTP adapter that revalidates cached GET responses with conditional requests.
+
+    Only successful GET responses with an ``ETag`` or ``Last-Modified`` header are
+    stored. Other methods (e.g. bookmark deletion) pass straight through.
+    """
+
+    def __init__(self, cache_dir: Path, **kwargs: Any) -> None:
+        """Initialize the adapter.
+
+        Args:
+            cache_dir: Directory for cached response metadata and bodies.
+            **kwargs: Extra arguments forwarded to `HTTPAdapter`.
+        """
+        super().__init__(**kwargs)
+        self.cache_dir = cache_dir
+        self._pruned = False
+
+    def send(self, request: PreparedRequest, *args: Any, **kwargs: Any) -> Response:
+        """Send a request, revalidating against the on-disk cache for GETs.
+
+        Args:
+            request: The prepared request.
+            *args: Positional arguments forwarded to `HTTPAdapter.send`.
+            **kwargs: Keyword arguments forwarded to `HTTPAdapter.send`.
+
+        Returns:
+            The live response, or a response rebuilt from the cache on 304.
+        """
+        if request.method != "GET" or not request.url:
+            return super().send(request, *args, **kwargs)
+
+        if not self._pruned:
+            self._pruned = True
+            self._prune()
+
+        key = _cache_key(request.method, request.url)
+        entry = self._load(key)
+        if entry is not None:
+            meta, _ = entry
+            headers = CaseInsensitiveDict(meta["headers"])
+            if etag := headers.get("ETag"):
+                request.headers["If-None-Match"] = etag
+            if last_modified := headers.get("Last-Modified"):
+                request.headers["If-Modified-Since"] = last_modified
+
+        response = super().send(request, *args, **kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            response.close()
+            if _stdlib_logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Serving cached response", url=request.url)
+            meta, body = entry
+            # A 304 carries current headers (e.g. rate-limit budget) that
+            # supersede the stored ones
+            meta["headers"] = _merge_headers(meta["headers"], response.headers)
+            self._store_meta(key, meta)
+            return self._build_response(request, meta, body)
+
+        if response.status_code == 200 and (
+            "ETag" in response.headers or "Last-Modified" in response.headers
+        ):
+            self._store(key, response)
+
+        return response
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        """Get the metadata and body paths for a cache key."""
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.body"
+
+    def _load(self, key: str) -> tuple[dict[str, Any], bytes] | None:
+        """Load a cache entry.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Tuple of (metadata, body), or None if missing or unreadable.
+        """
+        meta_path, body_path = self._paths(key)
+        try:
+            meta = orjson.loads(meta_path.read_bytes())
+            body = body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        if not isinstance(meta, dict) or not isinstance(meta.get("headers"), dict):
+            return None
+        # Entries whose body does not match the metadata are never replayed
+        if meta.get("body_sha256") != hashlib.sha256(body).hexdigest():
+            return None
+        return meta, body
+
+    def _store(self, key: str, response: Response) -> None:
+        """Persist a response to the cache (best effort).
+
+        Both files are replaced atomically and the metadata is written last,
+        so an interrupted or concurrent write never pairs it with another body.
+
+        Args:
+            key: Cache key.
+            response: Response to store.
+        """
+        body = response.content
+        meta = {
+            "url": response.url,
+            "encoding": response.encoding,
+            "headers": _merge_headers({}, response.headers),
+            "body_sha256": hashlib.sha256(body).hexdigest(),
+        }
+        meta_path, body_path = self._paths(key)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            _write_atomic(body_path, body)
+            _write_atomic(meta_path, orjson.dumps(meta))
+        except OSError as e:
+            logger.warning("Failed to write HTTP cache entry", error=str(e))
+
+    def _store_meta(self, key: str, meta: dict[str, Any]) -> None:
+        """Rewrite the metadata of an existing cache entry (best effort).
+
+        Args:
+            key: Cache key.
+            meta: Updated response metadata.
+        """
+        meta_path, _ = self._paths(key)
+        try:
+            _write_atomic(meta_path, orjson.dumps(meta))
+        except OSError as e:
+            logger.warning("Failed to update HTTP cache entry", error=str(e))
+
+    def _prune(self) -> None:
+        """Delete cache files unused for `CACHE_MAX_AGE_SECONDS` (best effort).
+
+        An entry's metadata is rewritten whenever it is stored or revalidated,
+        so its modification time marks the last use; the body and any leftover
+        temp files of a stale entry are deleted with it.
+        """
+        cutoff = time.time() - CACHE_MAX_AGE_SECONDS
+        try:
+            paths = [(path, path.stat().st_mtime) for path in self.cache_dir.iterdir()]
+        except OSError:
+            return
+        fresh_keys = {
+            path.stem for path, mtime in paths if path.suffix == ".json" and mtime >= cutoff
+        }
+        removed = 0
+        for path, mtime in paths:
+            # Cache files are "<key>.<ext>"; temp files are ".<key>.<ext>.<random>.tmp"
+            key = path.name.lstrip(".").split(".", 1)[0]
+            if key in fresh_keys or mtime >= cutoff:
+                continue
+            with contextlib.suppress(OSError):
+                path.unlink()
+                removed += 1
+        if removed:
+            logger.debug("Pruned stale HTTP cache files", count=removed)
+
+    def _build_response(
+        self, request: PreparedRequest, meta: dict[str, Any], body: bytes
+    ) -> Response:
+        """Rebuild a 200 response from a cache entry.
+
+        Args:
+            request: The request being answered.
+            meta: Cached response metadata.
+            body: Cached response body.
+
+        Returns:
+            Response equivalent to the originally cached one.
+        """
+        response = Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.headers = CaseInsensitiveDict(meta["headers"])
+        response.encoding = meta.get("encoding")
+        response.url = request.url or meta.get("url", "")
+        response.request = request
+        response.connection = self
+        response._content = body
+        return response
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a file by swapping in a uniquely named sibling temp file.
+
+    Args:
+        path: Destination path.
+        data: File contents.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
+        raise
+
+
+def _merge_headers(stored: Mapping[str, str], fresh: Mapping[str, str]) -> dict[str, str]:
+    """Overlay fresh response headers on stored ones.
+
+    Header names are matched case-insensitively and wire-encoding headers
+    are dropped.
+
+    Args:
+        stored: Previously cached headers.
+        fresh: Headers of the live response.
+
+    Returns:
+        Merged headers suitable for the cache metadata.
+    """
+    merged = CaseInsensitiveDict(stored)
+    merged.update(fresh)
+    return {name: value for name, value in merged.items() if name.lower() not in _DROPPED_HEADERS}
+
+
+def _cache_key(method: str, url: str) -> str:
+    """Build the cache key for a request.
+
+    The URL already contains the encoded query parameters (including the
+    pagination token), so it identifies a page uniquely.
+
+    Args:
+        method: HTTP method.
+        url: Full request URL.
+
+    Returns:
+        Hex digest used as the cache file stem.
+    """
+    return hashlib.sha256(f"{method} {url}".encode()).hexdigest()
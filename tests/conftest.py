@@ -1,12 +1,16 @@
 """Shared pytest fixtures for the test suite.
 
 This module provides common fixtures used across multiple test files.
+
+The sample bookmark, sync settings, valid OAuth2 token, and PKCE code
+fixtures are session-scoped because no test modifies them (tests that need
+different settings use ``model_copy``); clients, state, and temporary
+directories are built per test since tests mutate them.
 """
 
 from __future__ import annotations
 
-import tempfile
-from collections.abc import Generator
+from collections.abc import Callable
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -16,8 +20,8 @@ import pytest
 from x2raindrop_cli.config import SyncSettings
 from x2raindrop_cli.models import BookmarkItem, BothBehavior, LinkMode
 from x2raindrop_cli.raindrop.client import MockRaindropClient, RaindropCollection
-from x2raindrop_cli.state import InMemoryState
-from x2raindrop_cli.x.auth_pkce import OAuth2Token
+from x2raindrop_cli.state import InMemoryState, SyncState
+from x2raindrop_cli.x.auth_pkce import OAuth2Token, PKCECodes, generate_pkce_codes
 from x2raindrop_cli.x.client import MockXClient
 
 if TYPE_CHECKING:
@@ -25,17 +29,22 @@ if TYPE_CHECKING:
 
 
 @pytest.fixture
-def temp_dir() -> Generator[Path, None, None]:
+def temp_dir(tmp_path: Path) -> Path:
     """Create a temporary directory for test files.
 
-    Yields:
+    Uses pytest's per-test ``tmp_path`` so directories live under one
+    session base directory that pytest prunes itself.
+
+    Args:
+        tmp_path: Unique per-test directory provided by pytest.
+
+    Returns:
         Path to the temporary directory.
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+    return tmp_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_bookmark() -> BookmarkItem:
     """Create a sample bookmark for testing.
 
@@ -53,7 +62,7 @@ def sample_bookmark() -> BookmarkItem:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_bookmark_no_urls() -> BookmarkItem:
     """Create a sample bookmark without external URLs.
 
@@ -71,7 +80,7 @@ def sample_bookmark_no_urls() -> BookmarkItem:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_bookmarks() -> list[BookmarkItem]:
     """Create a list of sample bookmarks.
 
@@ -109,7 +118,7 @@ def sample_bookmarks() -> list[BookmarkItem]:
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_oauth_token() -> OAuth2Token:
     """Create a sample OAuth2 token.
 
@@ -125,6 +134,16 @@ def sample_oauth_token() -> OAuth2Token:
     )
 
 
+@pytest.fixture(scope="session")
+def shared_pkce_codes() -> PKCECodes:
+    """Create PKCE codes shared by tests that only read them.
+
+    Returns:
+        A PKCECodes instance.
+    """
+    return generate_pkce_codes()
+
+
 @pytest.fixture
 def expired_oauth_token() -> OAuth2Token:
     """Create an expired OAuth2 token.
@@ -151,7 +170,7 @@ def mock_x_client(sample_bookmarks: list[BookmarkItem]) -> MockXClient:
     Returns:
         MockXClient instance.
     """
-    return MockXClient(bookmarks=sample_bookmarks, user_id="test_user_123")
+    return MockXClient(bookmarks=list(sample_bookmarks), user_id="test_user_123")
 
 
 @pytest.fixture
@@ -180,7 +199,23 @@ def in_memory_state() -> InMemoryState:
     return InMemoryState()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def open_state() -> Callable[[Path], SyncState]:
+    """Provide a helper that creates a state manager and loads it from disk.
+
+    Returns:
+        Function taking a state file path and returning the loaded SyncState.
+    """
+
+    def open_state(path: Path) -> SyncState:
+        state = SyncState(path)
+        state.load()
+        return state
+
+    return open_state
+
+
+@pytest.fixture(scope="session")
 def sync_settings() -> SyncSettings:
     """Create default sync settings for testing.
 
@@ -198,7 +233,7 @@ def sync_settings() -> SyncSettings:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sync_settings_with_remove() -> SyncSettings:
     """Create sync settings with remove_from_x enabled.
 
@@ -215,7 +250,7 @@ def sync_settings_with_remove() -> SyncSettings:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sync_settings_first_external() -> SyncSettings:
     """Create sync settings with first_external_url mode.
 
@@ -232,7 +267,7 @@ def sync_settings_first_external() -> SyncSettings:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sync_settings_both() -> SyncSettings:
     """Create sync settings with both link mode.
 
@@ -249,7 +284,7 @@ def sync_settings_both() -> SyncSettings:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sync_settings_both_two_raindrops() -> SyncSettings:
     """Create sync settings with both mode and two raindrops behavior.
 
@@ -266,7 +301,7 @@ def sync_settings_both_two_raindrops() -> SyncSettings:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sync_settings_dry_run() -> SyncSettings:
     """Create sync settings with dry_run enabled.
 
@@ -5,10 +5,14 @@ This module tests the PKCE authentication helpers and token management.
 
 from __future__ import annotations
 
-import json
+import re
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING
+from urllib.parse import parse_qs, urlsplit
+
+import orjson
+from pytest_mock import MockerFixture
 
 from x2raindrop_cli.x.auth_pkce import (
     OAuth2Token,
@@ -23,6 +27,9 @@ from x2raindrop_cli.x.auth_pkce import (
 if TYPE_CHECKING:
     pass
 
+# URL-safe base64 uses only alphanumeric, -, _
+URL_SAFE_PATTERN = re.compile(r"[A-Za-z0-9_-]+")
+
 
 class TestGeneratePkceCodes:
     """Tests for PKCE code generation."""
@@ -43,9 +50,9 @@ class TestGeneratePkceCodes:
         # Base64 encoding of 32 bytes = 43 characters (without padding)
         assert len(codes.verifier) >= 43
 
-    def test_challenge_is_different_from_verifier(self) -> None:
+    def test_challenge_is_different_from_verifier(self, shared_pkce_codes: PKCECodes) -> None:
         """Test that challenge is derived but different from verifier."""
-        codes = generate_pkce_codes()
+        codes = shared_pkce_codes
         assert codes.challenge != codes.verifier
 
     def test_generates_unique_codes(self) -> None:
@@ -56,14 +63,12 @@ class TestGeneratePkceCodes:
         assert codes1.verifier != codes2.verifier
         assert codes1.challenge != codes2.challenge
 
-    def test_codes_are_url_safe(self) -> None:
+    def test_codes_are_url_safe(self, shared_pkce_codes: PKCECodes) -> None:
         """Test that generated codes are URL-safe (no special chars)."""
-        codes = generate_pkce_codes()
+        codes = shared_pkce_codes
 
-        # URL-safe base64 uses only alphanumeric, -, _
-        allowed_chars = set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_")
-        assert all(c in allowed_chars for c in codes.verifier)
-        assert all(c in allowed_chars for c in codes.challenge)
+        assert URL_SAFE_PATTERN.fullmatch(codes.verifier)
+        assert URL_SAFE_PATTERN.fullmatch(codes.challenge)
 
 
 class TestGenerateState:
@@ -84,17 +89,15 @@ class TestGenerateState:
     def test_state_is_url_safe(self) -> None:
         """Test that state is URL-safe."""
         state = generate_state()
-        # URL-safe base64 uses only alphanumeric, -, _
-        allowed_chars = set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_")
-        assert all(c in allowed_chars for c in state)
+        assert URL_SAFE_PATTERN.fullmatch(state)
 
 
 class TestBuildAuthorizationUrl:
     """Tests for authorization URL building."""
 
-    def test_builds_valid_url(self) -> None:
+    def test_builds_valid_url(self, shared_pkce_codes: PKCECodes) -> None:
         """Test that a valid authorization URL is built."""
-        codes = generate_pkce_codes()
+        codes = shared_pkce_codes
         state = generate_state()
 
         url = build_authorization_url(
@@ -105,17 +108,19 @@ class TestBuildAuthorizationUrl:
             state=state,
         )
 
-        assert url.startswith("https://x.com/i/oauth2/authorize")
-        assert "client_id=test_client_id" in url
-        assert "redirect_uri=" in url
-        assert "scope=bookmark.read" in url
-        assert "code_challenge=" in url
-        assert f"state={state}" in url
-        assert "code_challenge_method=S256" in url
-
-    def test_includes_all_scopes(self) -> None:
+        split = urlsplit(url)
+        query = parse_qs(split.query)
+        assert (split.scheme, split.netloc, split.path) == ("https", "x.com", "/i/oauth2/authorize")
+        assert query["client_id"] == ["test_client_id"]
+        assert query["redirect_uri"] == ["http://localhost:8765/callback"]
+        assert query["scope"][0].split() == ["bookmark.read", "tweet.read"]
+        assert query["code_challenge"] == [codes.challenge]
+        assert query["state"] == [state]
+        assert query["code_challenge_method"] == ["S256"]
+
+    def test_includes_all_scopes(self, shared_pkce_codes: PKCECodes) -> None:
         """Test that all scopes are included."""
-        codes = generate_pkce_codes()
+        codes = shared_pkce_codes
 
         url = build_authorization_url(
             client_id="test_client_id",
@@ -126,9 +131,8 @@ class TestBuildAuthorizationUrl:
         )
 
         # Scopes should be space-separated (URL encoded as +)
-        assert "scope1" in url
-        assert "scope2" in url
-        assert "scope3" in url
+        query = parse_qs(urlsplit(url).query)
+        assert {"scope1", "scope2", "scope3"} <= set(query["scope"][0].split())
 
 
 class TestOAuth2Token:
@@ -161,27 +165,26 @@ class TestOAuth2Token:
         """Test is_expired returns True for expired token."""
         assert expired_oauth_token.is_expired() is True
 
-    def test_is_expired_considers_buffer(self) -> None:
+    def test_is_expired_considers_buffer(self, mocker: MockerFixture) -> None:
         """Test that is_expired considers 60 second buffer."""
-        # Token that expires in 30 seconds should be considered expired
-        token = OAuth2Token(
-            access_token="test",
-            refresh_token=None,
-            token_type="bearer",
-            expires_at=datetime.now() + timedelta(seconds=30),
-            scope="",
-        )
-        assert token.is_expired() is True
+        now = datetime(2024, 1, 15, 12, 0, 0)
+        mocker.patch("x2raindrop_cli.x.auth_pkce.datetime").now.return_value = now
+
+        def token_expiring_in(seconds: int) -> OAuth2Token:
+            return OAuth2Token(
+                access_token="test",
+                refresh_token=None,
+                token_type="bearer",
+                expires_at=now + timedelta(seconds=seconds),
+                scope="",
+            )
 
+        # Token that expires in 30 seconds should be considered expired
+        assert token_expiring_in(30).is_expired() is True
+        # The buffer boundary itself counts as expired
+        assert token_expiring_in(60).is_expired() is True
         # Token that expires in 120 seconds should not be expired
-        token2 = OAuth2Token(
-            access_token="test",
-            refresh_token=None,
-            token_type="bearer",
-            expires_at=datetime.now() + timedelta(seconds=120),
-            scope="",
-        )
-        assert token2.is_expired() is False
+        assert token_expiring_in(120).is_expired() is False
 
     def test_to_dict(self, sample_oauth_token: OAuth2Token) -> None:
         """Test converting token to dict."""
@@ -206,8 +209,8 @@ class TestOAuth2Token:
     def test_roundtrip_serialization(self, sample_oauth_token: OAuth2Token) -> None:
         """Test that token survives serialization roundtrip."""
         data = sample_oauth_token.to_dict()
-        json_str = json.dumps(data)
-        loaded_data = json.loads(json_str)
+        json_bytes = orjson.dumps(data)
+        loaded_data = orjson.loads(json_bytes)
         restored = OAuth2Token.from_dict(loaded_data)
 
         assert restored.access_token == sample_oauth_token.access_token
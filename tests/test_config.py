@@ -8,6 +8,8 @@ from __future__ import annotations
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import pytest
+
 from x2raindrop_cli.config import (
     SyncSettings,
     XSettings,
@@ -35,14 +37,27 @@ class TestGetDefaultPaths:
         assert config_path.name == "config.toml"
 
 
+@pytest.fixture(scope="module")
+def default_config_file(tmp_path_factory: pytest.TempPathFactory) -> tuple[Path, Path, str]:
+    """Create the default config file once for the read-only config tests.
+
+    Args:
+        tmp_path_factory: pytest's session temporary directory factory.
+
+    Returns:
+        Tuple of (requested path, returned path, file content).
+    """
+    config_path = tmp_path_factory.mktemp("config") / "config.toml"
+    created = create_default_config(config_path)
+    return config_path, created, config_path.read_text()
+
+
 class TestCreateDefaultConfig:
     """Tests for default config file creation."""
 
-    def test_creates_config_file(self, temp_dir: Path) -> None:
+    def test_creates_config_file(self, default_config_file: tuple[Path, Path, str]) -> None:
         """Test that config file is created."""
-        config_path = temp_dir / "config.toml"
-
-        created = create_default_config(config_path)
+        config_path, created, _ = default_config_file
 
         assert created == config_path
         assert config_path.exists()
@@ -55,30 +70,28 @@ class TestCreateDefaultConfig:
 
         assert config_path.exists()
 
-    def test_config_contains_required_sections(self, temp_dir: Path) -> None:
-        """Test that created config contains required sections."""
-        config_path = temp_dir / "config.toml"
-        create_default_config(config_path)
-
-        content = config_path.read_text()
-
-        assert "[x]" in content
-        assert "[raindrop]" in content
-        assert "[sync]" in content
-
-    def test_config_contains_placeholder_values(self, temp_dir: Path) -> None:
-        """Test that config contains placeholder values."""
-        config_path = temp_dir / "config.toml"
-        create_default_config(config_path)
-
-        content = config_path.read_text()
-
-        # X section has empty placeholders for both auth methods
-        assert "access_token" in content
-        assert "client_id" in content
-        assert "skip_existing_links" in content
-        # Raindrop still has placeholder
-        assert "YOUR_RAINDROP_TOKEN" in content
+    @pytest.mark.parametrize(
+        "expected",
+        [
+            # Required sections
+            "[x]",
+            "[raindrop]",
+            "[sync]",
+            # X section has empty placeholders for both auth methods
+            "access_token",
+            "client_id",
+            "skip_existing_links",
+            # Raindrop still has placeholder
+            "YOUR_RAINDROP_TOKEN",
+        ],
+    )
+    def test_config_contains(
+        self, default_config_file: tuple[Path, Path, str], expected: str
+    ) -> None:
+        """Test that created config contains required sections and placeholders."""
+        _, _, content = default_config_file
+
+        assert expected in content
 
 
 class TestXSettings:
@@ -128,14 +141,14 @@ class TestXSettings:
 
     def test_default_redirect_uri(self) -> None:
         """Test default redirect URI."""
-        settings = XSettings()
+        settings = XSettings(_env_file=None)
 
         assert "127.0.0.1" in settings.redirect_uri
         assert "callback" in settings.redirect_uri
 
     def test_default_scopes(self) -> None:
         """Test default scopes include required ones."""
-        settings = XSettings()
+        settings = XSettings(_env_file=None)
 
         assert "bookmark.read" in settings.scopes
         assert "bookmark.write" in settings.scopes
@@ -148,7 +161,7 @@ class TestSyncSettings:
 
     def test_default_values(self) -> None:
         """Test default values for sync settings."""
-        settings = SyncSettings()
+        settings = SyncSettings(_env_file=None)
 
         assert settings.collection_id is None
         assert settings.tags == []
@@ -160,22 +173,22 @@ class TestSyncSettings:
 
     def test_parse_tags_from_string(self) -> None:
         """Test parsing tags from comma-separated string."""
-        settings = SyncSettings(tags="tag1, tag2, tag3")
+        settings = SyncSettings(tags="tag1, tag2, tag3", _env_file=None)
 
         assert settings.tags == ["tag1", "tag2", "tag3"]
 
     def test_parse_tags_from_list(self) -> None:
         """Test parsing tags from list."""
-        settings = SyncSettings(tags=["tag1", "tag2"])
+        settings = SyncSettings(tags=["tag1", "tag2"], _env_file=None)
 
         assert settings.tags == ["tag1", "tag2"]
 
     def test_parse_empty_tags(self) -> None:
         """Test parsing empty tags."""
-        settings = SyncSettings(tags="")
+        settings = SyncSettings(tags="", _env_file=None)
         assert settings.tags == []
 
-        settings2 = SyncSettings(tags=None)
+        settings2 = SyncSettings(tags=None, _env_file=None)
         assert settings2.tags == []
 
     def test_loads_from_env(self, monkeypatch: MonkeyPatch) -> None:
@@ -196,19 +209,19 @@ class TestSyncSettings:
 
     def test_link_mode_enum_values(self) -> None:
         """Test setting link_mode with enum values."""
-        settings1 = SyncSettings(link_mode=LinkMode.PERMALINK)
+        settings1 = SyncSettings(link_mode=LinkMode.PERMALINK, _env_file=None)
         assert settings1.link_mode == LinkMode.PERMALINK
 
-        settings2 = SyncSettings(link_mode=LinkMode.FIRST_EXTERNAL_URL)
+        settings2 = SyncSettings(link_mode=LinkMode.FIRST_EXTERNAL_URL, _env_file=None)
         assert settings2.link_mode == LinkMode.FIRST_EXTERNAL_URL
 
-        settings3 = SyncSettings(link_mode=LinkMode.BOTH)
+        settings3 = SyncSettings(link_mode=LinkMode.BOTH, _env_file=None)
         assert settings3.link_mode == LinkMode.BOTH
 
     def test_both_behavior_enum_values(self) -> None:
         """Test setting both_behavior with enum values."""
-        settings1 = SyncSettings(both_behavior=BothBehavior.ONE_EXTERNAL_PLUS_NOTE)
+        settings1 = SyncSettings(both_behavior=BothBehavior.ONE_EXTERNAL_PLUS_NOTE, _env_file=None)
         assert settings1.both_behavior == BothBehavior.ONE_EXTERNAL_PLUS_NOTE
 
-        settings2 = SyncSettings(both_behavior=BothBehavior.TWO_RAINDROPS)
+        settings2 = SyncSettings(both_behavior=BothBehavior.TWO_RAINDROPS, _env_file=None)
         assert settings2.both_behavior == BothBehavior.TWO_RAINDROPS
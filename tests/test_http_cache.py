@@ -0,0 +1,272 @@
+"""Tests for the conditional GET response cache.
+
+This module tests ETag/Last-Modified revalidation and 304 replay.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import requests
+from pytest_mock import MockerFixture
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from x2raindrop_cli.x.auth_pkce import OAuth2Token
+from x2raindrop_cli.x.client import MAX_POOL_CONNECTIONS, XClient
+from x2raindrop_cli.x.http_cache import CACHE_MAX_AGE_SECONDS, ConditionalCacheAdapter
+
+if TYPE_CHECKING:
+    pass
+
+URL = "https://api.x.com/2/users/1/bookmarks?max_results=100"
+
+
+def _make_response(
+    request: requests.PreparedRequest,
+    status_code: int,
+    body: bytes = b"",
+    headers: dict[str, str] | None = None,
+) -> requests.Response:
+    """Build a fake live response."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers or {})
+    response.raw = io.BytesIO(body)
+    response.url = request.url or ""
+    response.request = request
+    return response
+
+
+def _responder(
+    status_code: int,
+    body: bytes = b"",
+    headers: dict[str, str] | None = None,
+) -> Callable[..., requests.Response]:
+    """Build a fake ``HTTPAdapter.send`` that echoes the request into a response."""
+
+    def send(request: requests.PreparedRequest, *_args: Any, **_kwargs: Any) -> requests.Response:
+        return _make_response(request, status_code, body, headers)
+
+    return send
+
+
+def _prepare(method: str = "GET", url: str = URL) -> requests.PreparedRequest:
+    """Prepare a request for the adapter."""
+    return requests.Request(method, url).prepare()
+
+
+class TestConditionalCacheAdapter:
+    """Tests for ConditionalCacheAdapter."""
+
+    def test_stores_response_with_etag(self, temp_dir: Path, mocker: MockerFixture) -> None:
+        """Test that GET responses with an ETag are cached."""
+        mocker.patch.object(
+            HTTPAdapter,
+            "send",
+            side_effect=_responder(200, b'{"data": []}', {"ETag": '"v1"'}),
+        )
+        adapter = ConditionalCacheAdapter(temp_dir)
+
+        response = adapter.send(_prepare())
+
+        assert response.json() == {"data": []}
+        assert len(list(temp_dir.glob("*.body"))) == 1
+
+    def test_sends_validators_and_replays_on_304(
+        self, temp_dir: Path, mocker: MockerFixture
+    ) -> None:
+        """Test that cached validators are sent and a 304 replays the cached body."""
+        send = mocker.patch.object(
+            HTTPAdapter,
+            "send",
+            side_effect=[
+                _make_response(
+                    _prepare(),
+                    200,
+                    b'{"data": [{"id": "1"}]}',
+                    {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"},
+                ),
+                _make_response(_prepare(), 304),
+            ],
+        )
+        adapter = ConditionalCacheAdapter(temp_dir)
+        adapter.send(_prepare())
+
+        second_request = _prepare()
+        response = adapter.send(second_request)
+
+        assert send.call_count == 2
+        assert second_request.headers["If-None-Match"] == '"v1"'
+        assert second_request.headers["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+        assert response.status_code == 200
+        assert response.json() == {"data": [{"id": "1"}]}
+
+    def test_304_headers_override_cached_headers(
+        self, temp_dir: Path, mocker: MockerFixture
+    ) -> None:
+        """Test that headers of a live 304 replace the cached ones and are persisted."""
+        mocker.patch.object(
+            HTTPAdapter,
+            "send",
+            side_effect=[
+                _make_response(
+                    _prepare(),
+                    200,
+                    b'{"data": []}',
+                    {
+                        "ETag": '"v1"',
+                        "x-rate-limit-remaining": "5",
+                        "x-rate-limit-reset": "1000",
+                    },
+                ),
+                _make_response(
+                    _prepare(),
+                    304,
+                    headers={"x-rate-limit-remaining": "0", "x-rate-limit-reset": "2000"},
+                ),
+                _make_response(_prepare(), 304),
+            ],
+        )
+        adapter = ConditionalCacheAdapter(temp_dir)
+        adapter.send(_prepare())
+
+        revalidated = adapter.send(_prepare())
+        replayed = adapter.send(_prepare())
+
+        for response in (revalidated, replayed):
+            assert response.headers["x-rate-limit-remaining"] == "0"
+            assert response.headers["x-rate-limit-reset"] == "2000"
+            assert response.headers["ETag"] == '"v1"'
+            assert response.json() == {"data": []}
+
+    def test_ignores_entry_with_mismatched_body(
+        self, temp_dir: Path, mocker: MockerFixture
+    ) -> None:
+        """Test that metadata paired with a different body is not replayed."""
+        mocker.patch.object(
+            HTTPAdapter,
+            "send",
+            side_effect=_responder(200, b'{"data": []}', {"ETag": '"v1"'}),
+        )
+        adapter = ConditionalCacheAdapter(temp_dir)
+        adapter.send(_prepare())
+        (body_path,) = temp_dir.glob("*.body")
+        body_path.write_bytes(b'{"data": [{"id": "other"}]}')
+
+        second_request = _prepare()
+        adapter.send(second_request)
+
+        assert "If-None-Match" not in second_request.headers
+        assert list(temp_dir.glob("*.tmp")) == []
+
+    def test_prunes_stale_entries(self, temp_dir: Path, mocker: MockerFixture) -> None:
+        """Test that entries unused for the maximum age are deleted and fresh ones kept."""
+        mocker.patch.object(
+            HTTPAdapter,
+            "send",
+            side_effect=_responder(200, b'{"data": []}', {"ETag": '"v1"'}),
+        )
+        ConditionalCacheAdapter(temp_dir).send(_prepare())
+        fresh_files = set(temp_dir.iterdir())
+        stale_files = [temp_dir / "old.json", temp_dir / "old.body", temp_dir / ".old.json.x.tmp"]
+        stale_time = time.time() - CACHE_MAX_AGE_SECONDS - 60
+        for path in stale_files:
+            path.write_bytes(b"{}")
+            os.utime(path, (stale_time, stale_time))
+
+        ConditionalCacheAdapter(temp_dir).send(_prepare(url=URL + "&pagination_token=next"))
+
+        assert fresh_files < set(temp_dir.iterdir())
+        assert not any(path.exists() for path in stale_files)
+
+    def test_does_not_cache_without_validators(self, temp_dir: Path, mocker: MockerFixture) -> None:
+        """Test that responses without ETag/Last-Modified are not cached."""
+        mocker.patch.object(
+            HTTPAdapter,
+            "send",
+            side_effect=_responder(200, b"{}"),
+        )
+        adapter = ConditionalCacheAdapter(temp_dir)
+
+        adapter.send(_prepare())
+
+        assert list(temp_dir.iterdir()) == []
+
+    def test_skips_non_get_requests(self, temp_dir: Path, mocker: MockerFixture) -> None:
+        """Test that DELETE requests bypass the cache."""
+        mocker.patch.object(
+            HTTPAdapter,
+            "send",
+            side_effect=_responder(200, b"{}", {"ETag": '"v1"'}),
+        )
+        adapter = ConditionalCacheAdapter(temp_dir)
+
+        adapter.send(_prepare("DELETE", "https://api.x.com/2/users/1/bookmarks/2"))
+
+        assert list(temp_dir.iterdir()) == []
+
+
+ME_BODY = b'{"data": {"id": "42", "name": "Test User", "username": "test"}}'
+
+
+class TestXClientCache:
+    """Tests for the response cache behind XClient."""
+
+    def test_revalidates_with_cache_dir(
+        self, sample_oauth_token: OAuth2Token, temp_dir: Path, mocker: MockerFixture
+    ) -> None:
+        """Test a configured cache revalidates and replays responses across clients."""
+        send = mocker.patch.object(
+            HTTPAdapter, "send", side_effect=_responder(200, ME_BODY, {"ETag": '"v1"'})
+        )
+        assert XClient(sample_oauth_token, cache_dir=temp_dir).get_authenticated_user_id() == "42"
+
+        send.side_effect = _responder(304)
+        client = XClient(sample_oauth_token, cache_dir=temp_dir)
+
+        assert client.get_authenticated_user_id() == "42"
+        assert send.call_args.args[0].headers["If-None-Match"] == '"v1"'
+
+    def test_no_cache_by_default(
+        self, sample_oauth_token: OAuth2Token, mocker: MockerFixture
+    ) -> None:
+        """Test that requests are not revalidated without a cache directory."""
+        send = mocker.patch.object(
+            HTTPAdapter, "send", side_effect=_responder(200, ME_BODY, {"ETag": '"v1"'})
+        )
+        XClient(sample_oauth_token).get_authenticated_user_id()
+
+        XClient(sample_oauth_token).get_authenticated_user_id()
+
+        assert send.call_count == 2
+        assert "If-None-Match" not in send.call_args.args[0].headers
+
+    def test_clients_share_adapter(
+        self, sample_oauth_token: OAuth2Token, mocker: MockerFixture
+    ) -> None:
+        """Test clients reuse one connection pool and closing one keeps it open."""
+        adapters: list[HTTPAdapter] = []
+        respond = _responder(200, ME_BODY)
+
+        def send(adapter: HTTPAdapter, request: requests.PreparedRequest, **kwargs: Any) -> Any:
+            adapters.append(adapter)
+            return respond(request, **kwargs)
+
+        mocker.patch.object(HTTPAdapter, "send", autospec=True, side_effect=send)
+        first = XClient(sample_oauth_token)
+        second = XClient(sample_oauth_token)
+        first.get_authenticated_user_id()
+        second.get_authenticated_user_id()
+        close = mocker.spy(adapters[0], "close")
+
+        first.close()
+
+        assert adapters[0] is adapters[1]
+        assert adapters[0].poolmanager.connection_pool_kw["maxsize"] == MAX_POOL_CONNECTIONS
+        close.assert_not_called()
@@ -1,11 +1,13 @@
 """Tests for domain models.
 
-This module tests the Pydantic models used throughout the application.
+This module tests the domain models used throughout the application.
 """
 
 from __future__ import annotations
 
+from dataclasses import FrozenInstanceError
 from datetime import datetime
+from enum import StrEnum
 from typing import TYPE_CHECKING
 
 import pytest
@@ -23,38 +25,23 @@ if TYPE_CHECKING:
     pass
 
 
-class TestLinkMode:
-    """Tests for LinkMode enum."""
+class TestEnums:
+    """Tests for the LinkMode and BothBehavior enums."""
 
-    def test_permalink_value(self) -> None:
-        """Test PERMALINK enum value."""
-        assert LinkMode.PERMALINK.value == "permalink"
-
-    def test_first_external_url_value(self) -> None:
-        """Test FIRST_EXTERNAL_URL enum value."""
-        assert LinkMode.FIRST_EXTERNAL_URL.value == "first_external_url"
-
-    def test_both_value(self) -> None:
-        """Test BOTH enum value."""
-        assert LinkMode.BOTH.value == "both"
-
-    def test_from_string(self) -> None:
-        """Test creating LinkMode from string."""
-        assert LinkMode("permalink") == LinkMode.PERMALINK
-        assert LinkMode("first_external_url") == LinkMode.FIRST_EXTERNAL_URL
-        assert LinkMode("both") == LinkMode.BOTH
-
-
-class TestBothBehavior:
-    """Tests for BothBehavior enum."""
-
-    def test_one_external_plus_note_value(self) -> None:
-        """Test ONE_EXTERNAL_PLUS_NOTE enum value."""
-        assert BothBehavior.ONE_EXTERNAL_PLUS_NOTE.value == "one_external_plus_note"
-
-    def test_two_raindrops_value(self) -> None:
-        """Test TWO_RAINDROPS enum value."""
-        assert BothBehavior.TWO_RAINDROPS.value == "two_raindrops"
+    @pytest.mark.parametrize(
+        ("enum_cls", "value", "member"),
+        [
+            (LinkMode, "permalink", LinkMode.PERMALINK),
+            (LinkMode, "first_external_url", LinkMode.FIRST_EXTERNAL_URL),
+            (LinkMode, "both", LinkMode.BOTH),
+            (BothBehavior, "one_external_plus_note", BothBehavior.ONE_EXTERNAL_PLUS_NOTE),
+            (BothBehavior, "two_raindrops", BothBehavior.TWO_RAINDROPS),
+        ],
+    )
+    def test_enum_value(self, enum_cls: type[StrEnum], value: str, member: StrEnum) -> None:
+        """Test each member's value and creating it from its string value."""
+        assert member.value == value
+        assert enum_cls(value) is member
 
 
 class TestBookmarkItem:
@@ -120,11 +107,25 @@ class TestBookmarkItem:
         title = bookmark.get_title()
         assert len(title) <= 150
 
+    def test_get_title_is_cached(self) -> None:
+        """Test that the title is built once and does not affect equality."""
+        bookmark = BookmarkItem(
+            tweet_id="12345",
+            text="Some text",
+            permalink="https://x.com/i/status/12345",
+        )
+        other = BookmarkItem(
+            tweet_id="12345",
+            text="Some text",
+            permalink="https://x.com/i/status/12345",
+        )
+
+        assert bookmark.get_title() is bookmark.get_title()
+        assert bookmark == other
+
     def test_immutable(self, sample_bookmark: BookmarkItem) -> None:
         """Test that BookmarkItem is immutable (frozen)."""
-        from pydantic import ValidationError
-
-        with pytest.raises(ValidationError):
+        with pytest.raises(FrozenInstanceError):
             sample_bookmark.tweet_id = "new_id"  # type: ignore
 
 
@@ -137,7 +138,7 @@ class TestRaindropCreateRequest:
             link="https://example.com",
             title="Example Title",
             excerpt="Example excerpt",
-            tags=["tag1", "tag2"],
+            tags=("tag1", "tag2"),
             collection_id=100,
             note="Additional note",
             source_tweet_id="12345",
@@ -145,7 +146,7 @@ class TestRaindropCreateRequest:
 
         assert request.link == "https://example.com"
         assert request.title == "Example Title"
-        assert request.tags == ["tag1", "tag2"]
+        assert request.tags == ("tag1", "tag2")
         assert request.collection_id == 100
         assert request.note == "Additional note"
         assert request.source_tweet_id == "12345"
@@ -160,9 +161,20 @@ class TestRaindropCreateRequest:
 
         assert request.title is None
         assert request.excerpt is None
-        assert request.tags == []
+        assert request.tags == ()
         assert request.note is None
 
+    def test_immutable(self) -> None:
+        """Test that RaindropCreateRequest is immutable (frozen)."""
+        request = RaindropCreateRequest(
+            link="https://example.com",
+            collection_id=100,
+            source_tweet_id="12345",
+        )
+
+        with pytest.raises(FrozenInstanceError):
+            request.link = "https://other.example.com"  # type: ignore
+
 
 class TestSyncedBookmark:
     """Tests for SyncedBookmark model."""
@@ -187,6 +199,13 @@ class TestSyncedBookmark:
         assert synced.raindrop_links == []
         assert synced.deleted_from_x is False
 
+    def test_immutable(self) -> None:
+        """Test that SyncedBookmark is immutable (frozen)."""
+        synced = SyncedBookmark(tweet_id="12345")
+
+        with pytest.raises(FrozenInstanceError):
+            synced.deleted_from_x = True  # type: ignore
+
 
 class TestSyncResult:
     """Tests for SyncResult model."""
@@ -212,6 +231,14 @@ class TestSyncResult:
         assert "Error 1" in result.errors
         assert "Error 2" in result.errors
 
+    def test_add_errors(self) -> None:
+        """Test adding several errors at once."""
+        result = SyncResult()
+        result.add_error("Error 1")
+        result.add_errors(["Error 2", "Error 3"])
+
+        assert result.errors == ["Error 1", "Error 2", "Error 3"]
+
     def test_modify_counts(self) -> None:
         """Test modifying result counts."""
         result = SyncResult()
@@ -5,12 +5,28 @@ This module tests the Raindrop.io API client wrapper.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+from unittest.mock import MagicMock
+
+import orjson
+from pytest_mock import MockerFixture
+from raindropio import CollectionRef
+from requests.adapters import HTTPAdapter
 
 from x2raindrop_cli.models import RaindropCreateRequest
 from x2raindrop_cli.raindrop.client import (
+    API_BASE_URL,
+    MAX_BATCH_CREATE_SIZE,
+    MAX_CONCURRENT_REQUESTS,
+    MAX_RATE_LIMIT_WAIT_SECONDS,
+    PREFETCH_MIN_CHECKS_PER_PAGE,
+    PREFETCH_MIN_LINK_CHECKS,
+    PREFETCH_PAGE_SIZE,
+    REQUEST_RETRY,
     MockRaindropClient,
+    RaindropClient,
     RaindropCollection,
+    RateLimitRetry,
 )
 
 if TYPE_CHECKING:
@@ -71,6 +87,31 @@ class TestMockRaindropClient:
 
         assert len(result) >= 1  # Has default collections
 
+    def test_created_links(self) -> None:
+        """Test created links are tracked for membership checks."""
+        client = MockRaindropClient()
+
+        client.create_raindrop(
+            RaindropCreateRequest(
+                link="https://example.com/page/",
+                collection_id=100,
+                source_tweet_id="1",
+            )
+        )
+
+        assert "https://example.com/page" in client.created_links
+        assert "https://example.com/other" not in client.created_links
+
+    def test_check_link_exists_uses_client_normalization(self) -> None:
+        """Test the mock matches links with the same rule as the real client."""
+        client = MockRaindropClient(
+            existing_links=["HTTPS://Example.com/a/", "https://app.example/#/a"]
+        )
+
+        assert client.check_link_exists("https://example.com/a") is True
+        assert client.check_link_exists("https://app.example/#/a") is True
+        assert client.check_link_exists("https://app.example/#/b") is False
+
     def test_get_collection_by_title_found(self) -> None:
         """Test finding collection by title."""
         collections = [
@@ -95,6 +136,18 @@ class TestMockRaindropClient:
         assert result is not None
         assert result.id == 1
 
+    def test_get_collection_by_title_casefolds(self) -> None:
+        """Test title matching folds case beyond ASCII lowercasing."""
+        collections = [
+            RaindropCollection(id=1, title="Straße", count=10),
+        ]
+        client = MockRaindropClient(collections=collections)
+
+        result = client.get_collection_by_title("STRASSE")
+
+        assert result is not None
+        assert result.id == 1
+
     def test_get_collection_by_title_not_found(self) -> None:
         """Test finding collection by title when not found."""
         client = MockRaindropClient(collections=[])
@@ -111,7 +164,7 @@ class TestMockRaindropClient:
             link="https://example.com",
             title="Example",
             excerpt="An example link",
-            tags=["test"],
+            tags=("test",),
             collection_id=100,
             note="Note",
             source_tweet_id="12345",
@@ -189,6 +242,227 @@ class TestMockRaindropClient:
         assert client.check_link_exists("https://example.com") is False
 
 
+def _make_api_client(mocker: MockerFixture) -> tuple[RaindropClient, MagicMock]:
+    """Create a RaindropClient whose python-raindropio API object is a stub."""
+    api = MagicMock()
+    mocker.patch("x2raindrop_cli.raindrop.client.API", return_value=api)
+    return RaindropClient("test_token"), api
+
+
+def _json_response(data: dict[str, Any]) -> MagicMock:
+    """Build a fake API response with a JSON body."""
+    response = MagicMock()
+    response.content = orjson.dumps(data)
+    return response
+
+
+def _bulk_response(_url: str, json: dict[str, Any]) -> MagicMock:
+    """Build a fake bulk create response echoing the posted items."""
+    return _json_response(
+        {
+            "items": [
+                {"_id": int(item["title"]), "link": item["link"], "title": item["title"]}
+                for item in json["items"]
+            ]
+        }
+    )
+
+
+class TestRaindropClient:
+    """Tests for RaindropClient against a stubbed API."""
+
+    def test_retry_policy_resends_rate_limited_posts(self) -> None:
+        """Test that 429s are retried for any method but 5xx POSTs are not."""
+        assert REQUEST_RETRY.is_retry("POST", 429)
+        assert not REQUEST_RETRY.is_retry("POST", 503)
+        assert REQUEST_RETRY.is_retry("GET", 503)
+
+    def test_retry_policy_waits_for_rate_limit_reset(self, mocker: MockerFixture) -> None:
+        """Test that a 429 without Retry-After waits for X-RateLimit-Reset."""
+        mocker.patch("x2raindrop_cli.raindrop.client.time.time", return_value=1000.0)
+        response = MagicMock(status=429, headers={"X-RateLimit-Reset": "1030"})
+
+        assert RateLimitRetry().get_retry_after(response) == 30.0
+
+        response.headers = {"X-RateLimit-Reset": "5000"}
+        assert RateLimitRetry().get_retry_after(response) == MAX_RATE_LIMIT_WAIT_SECONDS
+
+    def test_waits_when_rate_limit_exhausted(self, mocker: MockerFixture) -> None:
+        """Test that requests wait for the reset once the budget is used up."""
+        client, api = _make_api_client(mocker)
+        api.ratelimit_remaining = 0
+        api.ratelimit_reset = 1010
+        mocker.patch("x2raindrop_cli.raindrop.client.time.time", return_value=1000.0)
+        sleep = mocker.patch("x2raindrop_cli.raindrop.client.time.sleep")
+
+        api.get.return_value = _json_response({"items": []})
+
+        client.check_link_exists("https://example.com/a", collection_id=100)
+        sleep.assert_called_once_with(10.0)
+
+        api.ratelimit_remaining = 5
+        client.check_link_exists("https://example.com/b", collection_id=100)
+        sleep.assert_called_once()
+        assert api.get.call_count == 2
+
+    def test_collection_ref_is_reused(self) -> None:
+        """Test that collection references are built once per collection ID."""
+        client = RaindropClient("test_token")
+
+        assert client.get_collection_ref(100) is client.get_collection_ref(100)
+        assert client.get_collection_ref(-1) is CollectionRef.Unsorted
+
+    def test_api_session_pools_connections(self) -> None:
+        """Test the API session mounts a pooled adapter with transient retries."""
+        client = RaindropClient("test_token")
+        session = client.api.session
+        assert session is not None
+
+        adapter = session.get_adapter(API_BASE_URL)
+
+        assert isinstance(adapter, HTTPAdapter)
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == MAX_CONCURRENT_REQUESTS
+        assert adapter.max_retries is REQUEST_RETRY
+        client.close()
+
+    def test_create_raindrops_splits_batches_and_keeps_order(self, mocker: MockerFixture) -> None:
+        """Test large creates are split into bulk calls and results keep request order."""
+        client, api = _make_api_client(mocker)
+        api.post.side_effect = _bulk_response
+        requests = [
+            RaindropCreateRequest(
+                link=f"https://example.com/{i}",
+                title=str(i),
+                collection_id=100,
+                source_tweet_id=str(i),
+            )
+            for i in range(MAX_BATCH_CREATE_SIZE * 2 + 5)
+        ]
+
+        created = client.create_raindrops(requests)
+
+        assert api.post.call_count == 3
+        assert [r.id for r in created] == list(range(len(requests)))
+        assert all(r.collection_id == 100 for r in created)
+        posted_sizes = sorted(len(call.kwargs["json"]["items"]) for call in api.post.call_args_list)
+        assert posted_sizes == [5, MAX_BATCH_CREATE_SIZE, MAX_BATCH_CREATE_SIZE]
+
+    def test_check_link_exists_searches_without_announced_checks(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Test each link is searched once when no large sync was announced."""
+        client, api = _make_api_client(mocker)
+        api.get.return_value = _json_response({"items": [{"link": "HTTPS://Example.com/a/"}]})
+
+        assert client.check_link_exists("https://example.com/a", collection_id=100) is True
+        assert client.check_link_exists("https://example.com/a", collection_id=100) is True
+        assert api.get.call_count == 1
+        assert "search=https%3A%2F%2Fexample.com%2Fa" in api.get.call_args.args[0]
+
+    def test_check_link_exists_keeps_fragment(self, mocker: MockerFixture) -> None:
+        """Test hash-routed links that differ only in their fragment are distinct."""
+        client, api = _make_api_client(mocker)
+        api.get.return_value = _json_response({"items": [{"link": "https://app.example/#/a"}]})
+
+        assert client.check_link_exists("https://app.example/#/a", collection_id=100) is True
+        assert client.check_link_exists("https://app.example/#/b", collection_id=100) is False
+
+    def test_small_sync_into_large_collection_searches(self, mocker: MockerFixture) -> None:
+        """Test a large collection is not paged in for a few announced checks."""
+        client, api = _make_api_client(mocker)
+        first_page = _json_response(
+            {
+                "count": PREFETCH_PAGE_SIZE * 100,
+                "items": [{"link": f"https://example.com/{i}"} for i in range(PREFETCH_PAGE_SIZE)],
+            }
+        )
+        search = _json_response({"items": []})
+        api.get.side_effect = [first_page, search, search]
+        client.expect_link_checks(PREFETCH_MIN_LINK_CHECKS, collection_id=100)
+
+        assert client.check_link_exists("https://example.com/new", collection_id=100) is False
+        assert client.check_link_exists("https://example.com/other", collection_id=100) is False
+        assert api.get.call_count == 3
+        assert api.get.call_args_list[0].kwargs["params"]["page"] == 0
+        assert all("search=" in call.args[0] for call in api.get.call_args_list[1:])
+
+    def test_large_sync_prefetches_collection_once(self, mocker: MockerFixture) -> None:
+        """Test the collection's links are paged in once and then looked up locally."""
+        client, api = _make_api_client(mocker)
+        total = PREFETCH_PAGE_SIZE * 2 + 7
+        page_count = 3
+
+        def fake_get(_url: str, params: dict[str, int]) -> MagicMock:
+            start = params["page"] * PREFETCH_PAGE_SIZE
+            stop = min(start + PREFETCH_PAGE_SIZE, total)
+            links = [f"https://example.com/{i}" for i in range(start, stop)]
+            if params["page"] == page_count - 1:
+                links[-1] = "https://Example.com/last/"
+            return _json_response({"count": total, "items": [{"link": link} for link in links]})
+
+        api.get.side_effect = fake_get
+        client.expect_link_checks(
+            max(PREFETCH_MIN_LINK_CHECKS, PREFETCH_MIN_CHECKS_PER_PAGE * page_count),
+            collection_id=100,
+        )
+
+        assert client.check_link_exists("https://example.com/3", collection_id=100) is True
+        assert client.check_link_exists("https://example.com/last", collection_id=100) is True
+        assert client.check_link_exists("https://example.com/missing", collection_id=100) is False
+        assert sorted(call.kwargs["params"]["page"] for call in api.get.call_args_list) == [0, 1, 2]
+
+    def test_created_links_are_added_to_known_links(self, mocker: MockerFixture) -> None:
+        """Test links created through the client are reported as existing."""
+        client, api = _make_api_client(mocker)
+        api.get.return_value = _json_response({"items": []})
+        api.post.side_effect = _bulk_response
+
+        assert client.check_link_exists("https://example.com/new", collection_id=100) is False
+        client.create_raindrops(
+            [
+                RaindropCreateRequest(
+                    link="https://example.com/new",
+                    title="1",
+                    collection_id=100,
+                    source_tweet_id="1",
+                )
+            ]
+        )
+
+        assert client.check_link_exists("https://example.com/new", collection_id=100) is True
+        assert api.get.call_count == 1
+
+    def test_collections_are_cached_and_indexed_by_title(self, mocker: MockerFixture) -> None:
+        """Test collections are listed once and title lookups use the cached index."""
+        client, _ = _make_api_client(mocker)
+        roots = [
+            MagicMock(id=1, title="Reading", count=3, parent=None),
+            MagicMock(id=2, title="reading", count=1, parent=None),
+        ]
+        get_roots = mocker.patch(
+            "x2raindrop_cli.raindrop.client.Collection.get_roots", return_value=roots
+        )
+        mocker.patch("x2raindrop_cli.raindrop.client.Collection.get_childrens", return_value=[])
+
+        assert len(client.list_collections()) == 2
+        found = client.get_collection_by_title("READING")
+        assert client.get_collection_by_title("missing") is None
+        assert found is not None
+        assert found.id == 1
+        assert get_roots.call_count == 1
+
+        client.refresh_collections()
+        client.list_collections()
+        assert get_roots.call_count == 2
+
+    def test_create_raindrops_empty(self, mocker: MockerFixture) -> None:
+        """Test no API call is made for an empty request list."""
+        client, api = _make_api_client(mocker)
+
+        assert client.create_raindrops([]) == []
+        api.post.assert_not_called()
+
+
 class TestRaindropCreateRequest:
     """Tests for RaindropCreateRequest model."""
 
@@ -198,7 +472,7 @@ class TestRaindropCreateRequest:
             link="https://example.com",
             title="Example Title",
             excerpt="Example excerpt",
-            tags=["tag1", "tag2"],
+            tags=("tag1", "tag2"),
             collection_id=100,
             note="A note",
             source_tweet_id="12345",
@@ -207,7 +481,7 @@ class TestRaindropCreateRequest:
         assert request.link == "https://example.com"
         assert request.title == "Example Title"
         assert request.excerpt == "Example excerpt"
-        assert request.tags == ["tag1", "tag2"]
+        assert request.tags == ("tag1", "tag2")
         assert request.collection_id == 100
         assert request.note == "A note"
         assert request.source_tweet_id == "12345"
@@ -223,5 +497,5 @@ class TestRaindropCreateRequest:
         assert request.link == "https://example.com"
         assert request.title is None
         assert request.excerpt is None
-        assert request.tags == []
+        assert request.tags == ()
         assert request.note is None
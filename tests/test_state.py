@@ -5,9 +5,14 @@ This module tests the local state store for tracking synced bookmarks.
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import pytest
+from pytest_mock import MockerFixture
+
 from x2raindrop_cli.state import InMemoryState, SyncState
 
 if TYPE_CHECKING:
@@ -17,10 +22,11 @@ if TYPE_CHECKING:
 class TestSyncState:
     """Tests for SyncState class."""
 
-    def test_load_nonexistent_file(self, temp_dir: Path) -> None:
+    def test_load_nonexistent_file(
+        self, temp_dir: Path, open_state: Callable[[Path], SyncState]
+    ) -> None:
         """Test loading state from non-existent file."""
-        state = SyncState(temp_dir / "state.json")
-        state.load()  # Should not raise
+        state = open_state(temp_dir / "state.json")  # Should not raise
 
         assert state.get_synced_count() == 0
 
@@ -37,6 +43,33 @@ class TestSyncState:
         assert state.is_synced("12345")
         assert not state.is_synced("other")
 
+    def test_synced_many(self, temp_dir: Path) -> None:
+        """Test bulk marking and checking of synced tweets."""
+        state = SyncState(temp_dir / "state.json")
+
+        state.mark_synced_many(
+            [("tweet1", ["https://link1.com"], False), ("tweet2", [], True)],
+        )
+
+        assert state.is_synced_many(["tweet1", "tweet2", "tweet3"]) == {"tweet1", "tweet2"}
+        first = state.get_synced("tweet1")
+        assert first is not None
+        record = state.get_synced("tweet2")
+        assert record is not None
+        assert record.deleted_from_x is True
+        assert record.synced_at == first.synced_at
+
+    def test_mark_synced_with_timestamp(self, temp_dir: Path) -> None:
+        """Test that a caller-provided sync timestamp is recorded."""
+        state = SyncState(temp_dir / "state.json")
+        synced_at = datetime(2024, 1, 15, 12, 0, 0)
+
+        state.mark_synced("12345", [], False, synced_at=synced_at)
+
+        record = state.get_synced("12345")
+        assert record is not None
+        assert record.synced_at == synced_at
+
     def test_get_synced(self, temp_dir: Path) -> None:
         """Test getting synced record."""
         state = SyncState(temp_dir / "state.json")
@@ -68,6 +101,21 @@ class TestSyncState:
         assert record is not None
         assert record.deleted_from_x is True
 
+    def test_mark_deleted_after_access(self, temp_dir: Path) -> None:
+        """Test marking an already accessed record as deleted keeps its data."""
+        state = SyncState(temp_dir / "state.json")
+        state.mark_synced("12345", ["https://example.com"], False)
+        original = state.get_synced("12345")
+        assert original is not None
+
+        state.mark_deleted("12345")
+
+        record = state.get_synced("12345")
+        assert record is not None
+        assert record.deleted_from_x is True
+        assert record.synced_at == original.synced_at
+        assert record.raindrop_links == ["https://example.com"]
+
     def test_mark_deleted_nonexistent_does_nothing(self, temp_dir: Path) -> None:
         """Test marking non-existent record as deleted does nothing."""
         state = SyncState(temp_dir / "state.json")
@@ -148,27 +196,115 @@ class TestSyncState:
         assert not state.is_synced("tweet1")
         assert not state.is_synced("tweet2")
 
-    def test_load_corrupted_json_starts_fresh(self, temp_dir: Path) -> None:
-        """Test that corrupted JSON file results in fresh state."""
+    def test_save_replaces_file_atomically(self, temp_dir: Path) -> None:
+        """Test that saving leaves only the state file behind."""
         state_path = temp_dir / "state.json"
-        state_path.write_text("not valid json {{{")
+        state_path.write_text("{}")
+        state = SyncState(state_path)
+        state.mark_synced("12345", [], False)
+
+        state.save()
+
+        assert [p.name for p in temp_dir.iterdir()] == ["state.json"]
+        assert '"12345"' in state_path.read_text()
+
+    def test_failed_save_removes_temp_file(self, temp_dir: Path, mocker: MockerFixture) -> None:
+        """Test that a failed swap keeps the old state and leaves no temp file behind."""
+        state_path = temp_dir / "state.json"
+        state_path.write_text("{}")
+        state = SyncState(state_path)
+        state.mark_synced("12345", [], False)
+        mocker.patch("x2raindrop_cli.state.os.replace", side_effect=OSError("disk full"))
+
+        with pytest.raises(OSError, match="disk full"):
+            state.save()
+
+        assert [p.name for p in temp_dir.iterdir()] == ["state.json"]
+        assert state_path.read_text() == "{}"
+
+    def test_loaded_records_converted_on_access(self, temp_dir: Path) -> None:
+        """Test that loaded records are converted lazily and saved unchanged."""
+        state_path = temp_dir / "state.json"
+        state_path.write_text(
+            '{"synced": {"tweet1": {"tweet_id": "tweet1", "raindrop_links": [],'
+            ' "synced_at": "2024-01-15T12:00:00", "deleted_from_x": false}}}'
+        )
 
         state = SyncState(state_path)
         state.load()
+        state.mark_synced("tweet2", [], False)
+        state.save()
+
+        record = state.get_synced("tweet1")
+        assert record is not None
+        assert record.synced_at == datetime(2024, 1, 15, 12, 0, 0)
+
+        reloaded = SyncState(state_path)
+        reloaded.load()
+        assert {r.tweet_id for r in reloaded.get_all_synced()} == {"tweet1", "tweet2"}
+
+    def test_load_corrupted_json_starts_fresh(
+        self, temp_dir: Path, open_state: Callable[[Path], SyncState]
+    ) -> None:
+        """Test that corrupted JSON file results in fresh state."""
+        state_path = temp_dir / "state.json"
+        state_path.write_text("not valid json {{{")
+
+        state = open_state(state_path)
 
         assert state.get_synced_count() == 0
 
-    def test_load_invalid_data_starts_fresh(self, temp_dir: Path) -> None:
+    def test_load_invalid_data_starts_fresh(
+        self, temp_dir: Path, open_state: Callable[[Path], SyncState]
+    ) -> None:
         """Test that invalid data structure results in fresh state."""
         state_path = temp_dir / "state.json"
         state_path.write_text('{"synced": {"tweet1": {"bad": "data"}}}')
 
-        state = SyncState(state_path)
-        state.load()
+        state = open_state(state_path)
 
         # Should start fresh due to invalid data structure
         assert state.get_synced_count() == 0
 
+    def test_load_malformed_timestamp_keeps_record(
+        self, temp_dir: Path, open_state: Callable[[Path], SyncState]
+    ) -> None:
+        """Test that an unparseable sync timestamp keeps the tweet synced."""
+        state_path = temp_dir / "state.json"
+        state_path.write_text(
+            '{"synced": {"tweet1": {"tweet_id": "tweet1", "synced_at": "yesterday"}}}'
+        )
+
+        state = open_state(state_path)
+        record = state.get_synced("tweet1")
+
+        assert state.is_synced("tweet1")
+        assert record is not None
+        assert record.synced_at == datetime.min
+
+    def test_load_non_object_record_starts_fresh(
+        self, temp_dir: Path, open_state: Callable[[Path], SyncState]
+    ) -> None:
+        """Test that a record that is not an object results in fresh state."""
+        state_path = temp_dir / "state.json"
+        state_path.write_text('{"synced": {"tweet1": ["tweet_id", "synced_at"]}}')
+
+        state = open_state(state_path)
+
+        assert state.get_synced_count() == 0
+        assert state.get_all_synced() == []
+
+    def test_load_wrong_field_type_starts_fresh(
+        self, temp_dir: Path, open_state: Callable[[Path], SyncState]
+    ) -> None:
+        """Test that a record with a mistyped field results in fresh state."""
+        state_path = temp_dir / "state.json"
+        state_path.write_text('{"synced": {"tweet1": {"tweet_id": "tweet1", "synced_at": 1}}}')
+
+        state = open_state(state_path)
+
+        assert state.get_synced_count() == 0
+
 
 class TestInMemoryState:
     """Tests for InMemoryState class."""
@@ -6,100 +6,103 @@ to Raindrop.io synchronization.
 
 from __future__ import annotations
 
+import threading
+from collections.abc import Callable, Iterable
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pytest
 
 from x2raindrop_cli.config import SyncSettings
-from x2raindrop_cli.models import BookmarkItem, BothBehavior, LinkMode
-from x2raindrop_cli.raindrop.client import MockRaindropClient
-from x2raindrop_cli.state import InMemoryState
+from x2raindrop_cli.models import BookmarkItem, BothBehavior, LinkMode, RaindropCreateRequest
+from x2raindrop_cli.raindrop.client import (
+    MAX_BATCH_CREATE_SIZE,
+    CreatedRaindrop,
+    MockRaindropClient,
+)
+from x2raindrop_cli.state import InMemoryState, SyncState
 from x2raindrop_cli.sync.service import (
     SyncService,
     create_raindrop_requests,
     resolve_links,
 )
-from x2raindrop_cli.x.client import MockXClient
+from x2raindrop_cli.x.client import (
+    DEFAULT_DELETE_CONCURRENCY,
+    DELETE_NOT_CONFIRMED_ERROR,
+    MockXClient,
+)
 
 if TYPE_CHECKING:
     pass
 
 
-class TestResolveLinks:
-    """Tests for link resolution logic."""
+PERMALINK = "https://x.com/testuser/status/1234567890"
+EXTERNAL_URL = "https://example.com/article"
+NO_URLS_PERMALINK = "https://x.com/anotheruser/status/9876543210"
 
-    def test_permalink_mode(self, sample_bookmark: BookmarkItem) -> None:
-        """Test PERMALINK mode returns just the permalink."""
-        links = resolve_links(
-            sample_bookmark,
-            LinkMode.PERMALINK,
-            BothBehavior.ONE_EXTERNAL_PLUS_NOTE,
-        )
-
-        assert len(links) == 1
-        assert links[0][0] == sample_bookmark.permalink
-        assert links[0][1] is None
 
-    def test_first_external_url_mode_with_urls(self, sample_bookmark: BookmarkItem) -> None:
-        """Test FIRST_EXTERNAL_URL mode with external URLs."""
-        links = resolve_links(
-            sample_bookmark,
-            LinkMode.FIRST_EXTERNAL_URL,
-            BothBehavior.ONE_EXTERNAL_PLUS_NOTE,
-        )
-
-        assert len(links) == 1
-        assert links[0][0] == sample_bookmark.external_urls[0]
-        assert sample_bookmark.permalink in links[0][1]  # Permalink in note
+class TestResolveLinks:
+    """Tests for link resolution logic."""
 
-    def test_first_external_url_mode_without_urls(
-        self, sample_bookmark_no_urls: BookmarkItem
+    @pytest.mark.parametrize(
+        ("bookmark_fixture", "link_mode", "both_behavior", "expected"),
+        [
+            pytest.param(
+                "sample_bookmark",
+                LinkMode.PERMALINK,
+                BothBehavior.ONE_EXTERNAL_PLUS_NOTE,
+                [(PERMALINK, None)],
+                id="permalink",
+            ),
+            pytest.param(
+                "sample_bookmark",
+                LinkMode.FIRST_EXTERNAL_URL,
+                BothBehavior.ONE_EXTERNAL_PLUS_NOTE,
+                [(EXTERNAL_URL, f"From: {PERMALINK}")],
+                id="first_external_url",
+            ),
+            pytest.param(
+                "sample_bookmark_no_urls",
+                LinkMode.FIRST_EXTERNAL_URL,
+                BothBehavior.ONE_EXTERNAL_PLUS_NOTE,
+                [(NO_URLS_PERMALINK, None)],
+                id="first_external_url_falls_back",
+            ),
+            pytest.param(
+                "sample_bookmark",
+                LinkMode.BOTH,
+                BothBehavior.ONE_EXTERNAL_PLUS_NOTE,
+                [(EXTERNAL_URL, f"X Post: {PERMALINK}")],
+                id="both_one_external_plus_note",
+            ),
+            pytest.param(
+                "sample_bookmark",
+                LinkMode.BOTH,
+                BothBehavior.TWO_RAINDROPS,
+                [(EXTERNAL_URL, f"From: {PERMALINK}"), (PERMALINK, None)],
+                id="both_two_raindrops",
+            ),
+            pytest.param(
+                "sample_bookmark_no_urls",
+                LinkMode.BOTH,
+                BothBehavior.TWO_RAINDROPS,
+                [(NO_URLS_PERMALINK, None)],
+                id="both_falls_back",
+            ),
+        ],
+    )
+    def test_resolve_links(
+        self,
+        request: pytest.FixtureRequest,
+        bookmark_fixture: str,
+        link_mode: LinkMode,
+        both_behavior: BothBehavior,
+        expected: list[tuple[str, str | None]],
     ) -> None:
-        """Test FIRST_EXTERNAL_URL mode falls back to permalink."""
-        links = resolve_links(
-            sample_bookmark_no_urls,
-            LinkMode.FIRST_EXTERNAL_URL,
-            BothBehavior.ONE_EXTERNAL_PLUS_NOTE,
-        )
-
-        assert len(links) == 1
-        assert links[0][0] == sample_bookmark_no_urls.permalink
-        assert links[0][1] is None
+        """Test the (link, note) pairs resolved for each mode and behavior."""
+        bookmark: BookmarkItem = request.getfixturevalue(bookmark_fixture)
 
-    def test_both_mode_one_external_plus_note(self, sample_bookmark: BookmarkItem) -> None:
-        """Test BOTH mode with ONE_EXTERNAL_PLUS_NOTE behavior."""
-        links = resolve_links(
-            sample_bookmark,
-            LinkMode.BOTH,
-            BothBehavior.ONE_EXTERNAL_PLUS_NOTE,
-        )
-
-        assert len(links) == 1
-        assert links[0][0] == sample_bookmark.external_urls[0]
-        assert sample_bookmark.permalink in links[0][1]
-
-    def test_both_mode_two_raindrops(self, sample_bookmark: BookmarkItem) -> None:
-        """Test BOTH mode with TWO_RAINDROPS behavior."""
-        links = resolve_links(
-            sample_bookmark,
-            LinkMode.BOTH,
-            BothBehavior.TWO_RAINDROPS,
-        )
-
-        assert len(links) == 2
-        assert links[0][0] == sample_bookmark.external_urls[0]
-        assert links[1][0] == sample_bookmark.permalink
-
-    def test_both_mode_without_urls_falls_back(self, sample_bookmark_no_urls: BookmarkItem) -> None:
-        """Test BOTH mode falls back to permalink when no external URLs."""
-        links = resolve_links(
-            sample_bookmark_no_urls,
-            LinkMode.BOTH,
-            BothBehavior.TWO_RAINDROPS,
-        )
-
-        assert len(links) == 1
-        assert links[0][0] == sample_bookmark_no_urls.permalink
+        assert resolve_links(bookmark, link_mode, both_behavior) == expected
 
 
 class TestCreateRaindropRequests:
@@ -112,7 +115,7 @@ class TestCreateRaindropRequests:
         requests = create_raindrop_requests(sample_bookmark, sync_settings)
 
         assert len(requests) == 1
-        assert requests[0].tags == sync_settings.tags
+        assert requests[0].tags == tuple(sync_settings.tags)
 
     def test_creates_request_with_collection_id(
         self, sample_bookmark: BookmarkItem, sync_settings: SyncSettings
@@ -264,6 +267,169 @@ class TestSyncService:
         assert "2222222222" in mock_x_client.deleted_tweet_ids
         assert "3333333333" in mock_x_client.deleted_tweet_ids
 
+    def test_sync_reports_failed_x_deletion(
+        self,
+        sample_bookmarks: list[BookmarkItem],
+        mock_raindrop_client: MockRaindropClient,
+        in_memory_state: InMemoryState,
+        sync_settings_with_remove: SyncSettings,
+    ) -> None:
+        """Test that a failed X deletion is reported but the bookmark stays synced."""
+
+        class FailingDeleteXClient(MockXClient):
+            def delete_bookmark(self, tweet_id: str) -> bool:
+                super().delete_bookmark(tweet_id)
+                return tweet_id != "2222222222"
+
+        x_client = FailingDeleteXClient(bookmarks=sample_bookmarks)
+        service = SyncService(
+            x_client=x_client,
+            raindrop_client=mock_raindrop_client,
+            state=in_memory_state,
+            settings=sync_settings_with_remove,
+        )
+
+        result = service.sync()
+
+        assert result.newly_synced == 3
+        assert result.deleted_from_x == 2
+        assert result.errors == [
+            f"[2222222222] Failed to delete from X: {DELETE_NOT_CONFIRMED_ERROR}"
+        ]
+        synced = in_memory_state.get_synced("2222222222")
+        assert synced is not None
+        assert synced.deleted_from_x is False
+        deleted = in_memory_state.get_synced("1111111111")
+        assert deleted is not None
+        assert deleted.deleted_from_x is True
+
+    def test_sync_reports_x_deletion_error_cause(
+        self,
+        sample_bookmarks: list[BookmarkItem],
+        mock_raindrop_client: MockRaindropClient,
+        in_memory_state: InMemoryState,
+        sync_settings_with_remove: SyncSettings,
+    ) -> None:
+        """Test that the cause of a failed X deletion is included in the error."""
+
+        class RaisingDeleteXClient(MockXClient):
+            def delete_bookmark(self, tweet_id: str) -> bool:
+                if tweet_id == "2222222222":
+                    raise RuntimeError("403 Forbidden")
+                return super().delete_bookmark(tweet_id)
+
+        service = SyncService(
+            x_client=RaisingDeleteXClient(bookmarks=sample_bookmarks),
+            raindrop_client=mock_raindrop_client,
+            state=in_memory_state,
+            settings=sync_settings_with_remove,
+        )
+
+        result = service.sync()
+
+        assert result.deleted_from_x == 2
+        assert result.errors == ["[2222222222] Failed to delete from X: 403 Forbidden"]
+
+    def test_sync_deletes_each_chunk_after_its_creates(
+        self,
+        temp_dir: Path,
+        open_state: Callable[[Path], SyncState],
+        sync_settings_with_remove: SyncSettings,
+    ) -> None:
+        """Test that each created chunk is saved to state and deleted before the next one."""
+        state_path = temp_dir / "state.json"
+        events: list[tuple[str, int]] = []
+        bookmarks = [
+            BookmarkItem(
+                tweet_id=str(i),
+                text=f"Bookmark {i}",
+                author_username="user",
+                permalink=f"https://x.com/user/status/{i}",
+            )
+            for i in range(MAX_BATCH_CREATE_SIZE + 1)
+        ]
+
+        class RecordingRaindropClient(MockRaindropClient):
+            def create_raindrops(
+                self, requests: list[RaindropCreateRequest]
+            ) -> list[CreatedRaindrop]:
+                events.append(("create", len(requests)))
+                return super().create_raindrops(requests)
+
+        class RecordingXClient(MockXClient):
+            def delete_bookmarks(
+                self, tweet_ids: Iterable[str], concurrency: int = DEFAULT_DELETE_CONCURRENCY
+            ) -> dict[str, str | None]:
+                tweet_ids = list(tweet_ids)
+                events.append(("delete", len(tweet_ids)))
+                # Records pending deletion are already on disk
+                saved = open_state(state_path)
+                assert saved.is_synced_many(tweet_ids) == set(tweet_ids)
+                return super().delete_bookmarks(tweet_ids, concurrency)
+
+        service = SyncService(
+            x_client=RecordingXClient(bookmarks=bookmarks),
+            raindrop_client=RecordingRaindropClient(),
+            state=SyncState(state_path),
+            settings=sync_settings_with_remove,
+        )
+
+        result = service.sync()
+
+        assert result.deleted_from_x == MAX_BATCH_CREATE_SIZE + 1
+        # Chunks are created concurrently but recorded and deleted in order
+        deletes = [event for event in events if event[0] == "delete"]
+        assert deletes == [("delete", MAX_BATCH_CREATE_SIZE), ("delete", 1)]
+        assert events.index(("create", 1)) < events.index(("delete", 1))
+        assert events.index(("create", MAX_BATCH_CREATE_SIZE)) < events.index(
+            ("delete", MAX_BATCH_CREATE_SIZE)
+        )
+        assert all(record.deleted_from_x for record in open_state(state_path).get_all_synced())
+
+    def test_sync_creates_chunks_concurrently(
+        self,
+        mock_x_client: MockXClient,
+        in_memory_state: InMemoryState,
+        sync_settings: SyncSettings,
+    ) -> None:
+        """Test that bulk creates of separate chunks run at the same time."""
+        barrier = threading.Barrier(2, timeout=5)
+        broken: list[BaseException] = []
+
+        class BarrierRaindropClient(MockRaindropClient):
+            def create_raindrops(
+                self, requests: list[RaindropCreateRequest]
+            ) -> list[CreatedRaindrop]:
+                try:
+                    barrier.wait()
+                except threading.BrokenBarrierError as error:
+                    broken.append(error)
+                    raise
+                return super().create_raindrops(requests)
+
+        mock_x_client.bookmarks = [
+            BookmarkItem(
+                tweet_id=str(i),
+                text=f"Bookmark {i}",
+                author_username="user",
+                permalink=f"https://x.com/user/status/{i}",
+            )
+            for i in range(MAX_BATCH_CREATE_SIZE + 1)
+        ]
+        raindrop_client = BarrierRaindropClient()
+        service = SyncService(
+            x_client=mock_x_client,
+            raindrop_client=raindrop_client,
+            state=in_memory_state,
+            settings=sync_settings,
+        )
+
+        result = service.sync()
+
+        assert broken == []
+        assert result.newly_synced == MAX_BATCH_CREATE_SIZE + 1
+        assert len(raindrop_client.batch_create_calls) == 2
+
     def test_sync_does_not_delete_when_disabled(
         self,
         mock_x_client: MockXClient,
@@ -355,7 +521,7 @@ class TestSyncService:
         assert result.newly_synced == 3
 
         # Check that external URLs are used when available
-        created_links = [r.link for r in mock_raindrop_client.created_raindrops]
+        created_links = mock_raindrop_client.created_links
         assert "https://first.example.com" in created_links
         assert "https://third.example.com" in created_links
         # Bookmark without external URL should use permalink
@@ -404,9 +570,10 @@ class TestSyncService:
         assert result.total_bookmarks == 3
         assert result.newly_synced == 2
         assert result.already_synced == 1
-        created_links = [request.link for request in raindrop_client.created_raindrops]
+        created_links = raindrop_client.created_links
         assert existing_link not in created_links
         assert in_memory_state.is_synced("2222222222")
+        assert raindrop_client.expected_link_checks == 3
 
     def test_sync_can_disable_existing_link_check(
         self,
@@ -415,14 +582,14 @@ class TestSyncService:
         sync_settings: SyncSettings,
     ) -> None:
         """Test existing-link check can be disabled."""
-        sync_settings.skip_existing_links = False
+        settings = sync_settings.model_copy(update={"skip_existing_links": False})
         existing_link = "https://x.com/user2/status/2222222222"
         raindrop_client = MockRaindropClient(existing_links=[existing_link])
         service = SyncService(
             x_client=mock_x_client,
             raindrop_client=raindrop_client,
             state=in_memory_state,
-            settings=sync_settings,
+            settings=settings,
         )
 
         result = service.sync()
@@ -430,8 +597,9 @@ class TestSyncService:
         assert result.total_bookmarks == 3
         assert result.newly_synced == 3
         assert result.already_synced == 0
-        created_links = [request.link for request in raindrop_client.created_raindrops]
+        created_links = raindrop_client.created_links
         assert existing_link in created_links
+        assert raindrop_client.expected_link_checks is None
 
 
 class TestSyncServiceIntegration:
@@ -486,7 +654,7 @@ class TestSyncServiceIntegration:
         assert len(mock_raindrop_client.batch_create_calls) == 1
         assert len(mock_raindrop_client.batch_create_calls[0]) == 3
 
-        created_links = [r.link for r in mock_raindrop_client.created_raindrops]
+        created_links = mock_raindrop_client.created_links
         assert "https://external.com" in created_links
         assert "https://x.com/user1/status/111" in created_links
         assert "https://x.com/user2/status/222" in created_links
@@ -5,11 +5,29 @@ This module tests the X API client and URL extraction logic.
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import TYPE_CHECKING
+import io
+import threading
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qs, urlsplit
+
+import orjson
+import requests
+from pytest_mock import MockerFixture
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 
 from x2raindrop_cli.models import BookmarkItem
-from x2raindrop_cli.x.client import MockXClient
+from x2raindrop_cli.x.auth_pkce import OAuth2Token
+from x2raindrop_cli.x.client import (
+    DELETE_NOT_CONFIRMED_ERROR,
+    MAX_RATE_LIMIT_WAIT_SECONDS,
+    RATE_LIMIT_WAIT_BUFFER_SECONDS,
+    MockXClient,
+    XClient,
+)
 
 if TYPE_CHECKING:
     pass
@@ -75,6 +93,390 @@ class TestMockXClient:
         assert "tweet_2" in client.deleted_tweet_ids
         assert "tweet_3" in client.deleted_tweet_ids
 
+    def test_delete_bookmarks_tracks_all(self) -> None:
+        """Test delete_bookmarks deletes every requested ID."""
+        client = MockXClient()
+
+        results = client.delete_bookmarks(["tweet_1", "tweet_2"])
+
+        assert results == {"tweet_1": None, "tweet_2": None}
+        assert client.deleted_tweet_ids == {"tweet_1", "tweet_2"}
+
+
+def _bookmarks_responder(
+    *pages: dict[str, Any],
+    requests_seen: list[requests.PreparedRequest] | None = None,
+) -> Callable[..., requests.Response]:
+    """Build a fake ``HTTPAdapter.send`` answering X bookmark page requests in order.
+
+    Args:
+        *pages: JSON bodies returned for consecutive requests.
+        requests_seen: Optional list receiving every request sent.
+    """
+    bodies = iter(pages)
+
+    def send(request: requests.PreparedRequest, *_args: Any, **_kwargs: Any) -> requests.Response:
+        if requests_seen is not None:
+            requests_seen.append(request)
+        response = requests.Response()
+        response.status_code = 200
+        response.raw = io.BytesIO(orjson.dumps(next(bodies, {"meta": {"result_count": 0}})))
+        response.url = request.url or ""
+        response.request = request
+        return response
+
+    return send
+
+
+def _url_entity(url: str, *, unwrapped: bool = False) -> dict[str, Any]:
+    """Build a tweet URL entity pointing at ``url``."""
+    key = "unwrapped_url" if unwrapped else "expanded_url"
+    return {"start": 0, "end": 23, "url": "https://t.co/abc", key: url}
+
+
+class TestExtractExternalUrls:
+    """Tests for external URL extraction from fetched bookmarks."""
+
+    def _fetch_external_urls(
+        self, token: OAuth2Token, mocker: MockerFixture, tweet: dict[str, Any]
+    ) -> list[str]:
+        """Fetch a single bookmarked tweet through mocked HTTP and return its URLs."""
+        page = {"data": [{"id": "1", **tweet}]}
+        mocker.patch.object(HTTPAdapter, "send", side_effect=_bookmarks_responder(page))
+        client = XClient(token)
+        client.set_user_id("user_1")
+        (bookmark,) = client.get_bookmarks()
+        return bookmark.external_urls
+
+    def test_keeps_external_entity_urls(
+        self, sample_oauth_token: OAuth2Token, mocker: MockerFixture
+    ) -> None:
+        """Test entity URLs on non-X hosts are kept, even if they contain X-like substrings."""
+        tweet = {
+            "text": "links",
+            "entities": {
+                "urls": [
+                    _url_entity("https://project.com/a"),
+                    _url_entity("https://fox.com/news"),
+                    _url_entity("https://example.com/b", unwrapped=True),
+                ]
+            },
+        }
+
+        urls = self._fetch_external_urls(sample_oauth_token, mocker, tweet)
+
+        assert urls == ["https://project.com/a", "https://fox.com/news", "https://example.com/b"]
+
+    def test_drops_x_hosted_entity_urls(
+        self, sample_oauth_token: OAuth2Token, mocker: MockerFixture
+    ) -> None:
+        """Test links back to X, Twitter, and t.co are filtered out."""
+        tweet = {
+            "text": "quoted",
+            "entities": {
+                "urls": [
+                    _url_entity("https://x.com/user/status/1"),
+                    _url_entity("https://mobile.twitter.com/user/status/2"),
+                    _url_entity("https://t.co/abc"),
+                    _url_entity("https://example.com/kept"),
+                ]
+            },
+        }
+
+        urls = self._fetch_external_urls(sample_oauth_token, mocker, tweet)
+
+        assert urls == ["https://example.com/kept"]
+
+    def test_falls_back_to_text(
+        self, sample_oauth_token: OAuth2Token, mocker: MockerFixture
+    ) -> None:
+        """Test URLs are extracted from text when there are no entities."""
+        tweet = {
+            "text": "See https://example.com/x and https://t.co/abc and https://x.com/u/status/1",
+        }
+
+        urls = self._fetch_external_urls(sample_oauth_token, mocker, tweet)
+
+        assert urls == ["https://example.com/x"]
+
+
+class TestXClientGetBookmarks:
+    """Tests for bookmark page parsing on XClient."""
+
+    def test_parses_page_model(
+        self, sample_oauth_token: OAuth2Token, mocker: MockerFixture
+    ) -> None:
+        """Test a bookmarks page response is converted into bookmark items."""
+        page = {
+            "data": [
+                {
+                    "id": "1",
+                    "text": "Read https://t.co/abc",
+                    "author_id": "42",
+                    "created_at": "2024-01-15T12:00:00.000Z",
+                    "entities": {"urls": [_url_entity("https://example.com/post")]},
+                },
+                {"id": "2", "text": "No links here", "author_id": "43"},
+            ],
+            "includes": {"users": [{"id": "42", "username": "alice", "name": "Alice"}]},
+        }
+        sent: list[requests.PreparedRequest] = []
+        mocker.patch.object(
+            HTTPAdapter, "send", side_effect=_bookmarks_responder(page, requests_seen=sent)
+        )
+        client = XClient(sample_oauth_token)
+        client.set_user_id("user_1")
+
+        bookmarks = list(client.get_bookmarks())
+
+        (request,) = sent
+        url = urlsplit(request.url or "")
+        query = parse_qs(url.query)
+        assert url.path == "/2/users/user_1/bookmarks"
+        assert query["max_results"] == ["100"]
+        assert query["expansions"] == ["author_id"]
+        assert query["tweet.fields"] == ["created_at,text,entities,author_id"]
+        assert query["user.fields"] == ["username,name"]
+
+        assert [b.tweet_id for b in bookmarks] == ["1", "2"]
+        assert bookmarks[0].author_username == "alice"
+        assert bookmarks[0].permalink == "https://x.com/alice/status/1"
+        assert bookmarks[0].external_urls == ["https://example.com/post"]
+        assert bookmarks[0].created_at is not None
+        assert bookmarks[0].created_at == datetime(2024, 1, 15, 12, 0, tzinfo=UTC)
+        assert bookmarks[1].author_username is None
+        assert bookmarks[1].external_urls == []
+
+    def test_page_size_follows_small_max_results(
+        self, sample_oauth_token: OAuth2Token, mocker: MockerFixture
+    ) -> None:
+        """Test a small max_results is used as the page size instead of 100."""
+        sent: list[requests.PreparedRequest] = []
+        mocker.patch.object(
+            HTTPAdapter, "send", side_effect=_bookmarks_responder(requests_seen=sent)
+        )
+        client = XClient(sample_oauth_token)
+        client.set_user_id("user_1")
+
+        list(client.get_bookmarks(max_results=5))
+
+        assert parse_qs(urlsplit(sent[0].url or "").query)["max_results"] == ["5"]
+
+
+def _delete_responder(
+    headers: dict[str, str] | None = None,
+    events: list[tuple[str, str]] | None = None,
+    status_codes: dict[str, int] | None = None,
+    still_bookmarked: set[str] | None = None,
+) -> Callable[..., requests.Response]:
+    """Build a fake ``HTTPAdapter.send`` answering X delete-bookmark requests.
+
+    Args:
+        headers: Headers added to every response (e.g. rate-limit budget).
+        events: Optional list receiving ("start"/"end", tweet ID) per request.
+        status_codes: Optional HTTP status code per tweet ID (default 200).
+        still_bookmarked: Tweet IDs whose deletion X does not confirm.
+    """
+    lock = threading.Lock()
+
+    def send(request: requests.PreparedRequest, *_args: Any, **_kwargs: Any) -> requests.Response:
+        tweet_id = (request.url or "").rsplit("/", 1)[-1]
+        if events is not None:
+            with lock:
+                events.append(("start", tweet_id))
+            time.sleep(0.01)
+            with lock:
+                events.append(("end", tweet_id))
+        bookmarked = tweet_id in (still_bookmarked or set())
+        response = requests.Response()
+        response.status_code = (status_codes or {}).get(tweet_id, 200)
+        response.headers = CaseInsensitiveDict(headers or {})
+        response.raw = io.BytesIO(orjson.dumps({"data": {"bookmarked": bookmarked}}))
+        response.url = request.url or ""
+        response.request = request
+        return response
+
+    return send
+
+
+def _rate_limit_headers(remaining: int, reset_in: float) -> dict[str, str]:
+    """Build X rate-limit headers for a window resetting ``reset_in`` seconds from now."""
+    return {
+        "x-rate-limit-remaining": str(remaining),
+        "x-rate-limit-reset": str(int(time.time() + reset_in)),
+    }
+
+
+class TestXClientDeleteBookmarks:
+    """Tests for concurrent bookmark deletion on XClient."""
+
+    def _make_client(self, token: OAuth2Token) -> XClient:
+        """Create an XClient with a known user ID."""
+        client = XClient(token)
+        client.set_user_id("user_1")
+        return client
+
+    def test_deletes_all_ids(self, sample_oauth_token: OAuth2Token, mocker: MockerFixture) -> None:
+        """Test every ID is deleted once and reported."""
+        send = mocker.patch.object(HTTPAdapter, "send", side_effect=_delete_responder())
+        client = self._make_client(sample_oauth_token)
+
+        results = client.delete_bookmarks(["1", "2", "3", "2"], concurrency=2)
+
+        assert results == {"1": None, "2": None, "3": None}
+        assert send.call_count == 3
+        assert client.request_count == 3
+
+    def test_failed_delete_reports_error(
+        self, sample_oauth_token: OAuth2Token, mocker: MockerFixture
+    ) -> None:
+        """Test failed or unconfirmed deletions report their cause without aborting the rest."""
+        responder = _delete_responder(status_codes={"2": 500}, still_bookmarked={"3"})
+        mocker.patch.object(HTTPAdapter, "send", side_effect=responder)
+        client = self._make_client(sample_oauth_token)
+
+        results = client.delete_bookmarks(["1", "2", "3"])
+
+        assert results["1"] is None
+        assert results["2"] is not None
+        assert results["2"].startswith("500 Server Error")
+        assert results["3"] == DELETE_NOT_CONFIRMED_ERROR
+
+    def test_first_delete_is_sent_alone(
+        self, sample_oauth_token: OAuth2Token, mocker: MockerFixture
+    ) -> None:
+        """Test the first deletion completes before any other is sent."""
+        events: list[tuple[str, str]] = []
+        mocker.patch.object(HTTPAdapter, "send", side_effect=_delete_responder(events=events))
+        client = self._make_client(sample_oauth_token)
+
+        results = client.delete_bookmarks(["1", "2", "3"], concurrency=3)
+
+        assert results == {"1": None, "2": None, "3": None}
+        assert events[:2] == [("start", "1"), ("end", "1")]
+
+    def test_waves_limited_to_remaining_budget(
+        self, sample_oauth_token: OAuth2Token, mocker: MockerFixture
+    ) -> None:
+        """Test waves never exceed the remaining budget reported by the API."""
+        events: list[tuple[str, str]] = []
+        responder = _delete_responder(_rate_limit_headers(1, 60), events=events)
+        mocker.patch.object(HTTPAdapter, "send", side_effect=responder)
+        client = self._make_client(sample_oauth_token)
+
+        client.delete_bookmarks(["1", "2", "3", "4"], concurrency=4)
+
+        # Every request finishes before the next one starts
+        assert [kind for kind, _ in events] == ["start", "end"] * 4
+
+    def test_waves_ignore_other_endpoint_budget(
+        self, sample_oauth_token: OAuth2Token, mocker: MockerFixture
+    ) -> None:
+        """Test waves are sized only from delete responses, not an earlier GET budget."""
+        events: list[tuple[str, str]] = []
+        respond_delete = _delete_responder(events=events)
+
+        def send(request: requests.PreparedRequest, *args: Any, **kwargs: Any) -> requests.Response:
+            if request.method != "GET":
+                return respond_delete(request, *args, **kwargs)
+            response = _delete_responder(_rate_limit_headers(1, 600))(request, *args, **kwargs)
+            response.raw = io.BytesIO(
+                orjson.dumps({"data": {"id": "42", "name": "N", "username": "n"}})
+            )
+            return response
+
+        mocker.patch.object(HTTPAdapter, "send", side_effect=send)
+        client = XClient(sample_oauth_token)
+
+        client.delete_bookmarks(["1", "2", "3"], concurrency=3)
+
+        # The probe runs alone, then both remaining deletes start together
+        assert [kind for kind, _ in events] == ["start", "end", "start", "start", "end", "end"]
+
+    def test_waits_when_rate_limit_exhausted(
+        self, sample_oauth_token: OAuth2Token, mocker: MockerFixture
+    ) -> None:
+        """Test an exhausted budget sleeps until the reported reset before sending more."""
+        send = mocker.patch.object(
+            HTTPAdapter, "send", side_effect=_delete_responder(_rate_limit_headers(0, 30))
+        )
+        sleep = mocker.patch("x2raindrop_cli.x.client.time.sleep")
+        client = self._make_client(sample_oauth_token)
+
+        results = client.delete_bookmarks(["1", "2"])
+
+        assert results == {"1": None, "2": None}
+        sleep.assert_called_once()
+        assert 29 <= sleep.call_args.args[0] <= 30 + RATE_LIMIT_WAIT_BUFFER_SECONDS
+        assert send.call_count == 2
+
+    def test_no_wait_after_window_reset(
+        self, sample_oauth_token: OAuth2Token, mocker: MockerFixture
+    ) -> None:
+        """Test an exhausted budget from a window that already reset does not sleep."""
+        mocker.patch.object(
+            HTTPAdapter, "send", side_effect=_delete_responder(_rate_limit_headers(0, -5))
+        )
+        sleep = mocker.patch("x2raindrop_cli.x.client.time.sleep")
+        client = self._make_client(sample_oauth_token)
+
+        client.delete_bookmarks(["1", "2"])
+
+        sleep.assert_not_called()
+
+    def test_no_wait_while_budget_remains(
+        self, sample_oauth_token: OAuth2Token, mocker: MockerFixture
+    ) -> None:
+        """Test a remaining budget lets requests through without sleeping."""
+        mocker.patch.object(
+            HTTPAdapter, "send", side_effect=_delete_responder(_rate_limit_headers(7, 60))
+        )
+        sleep = mocker.patch("x2raindrop_cli.x.client.time.sleep")
+        client = self._make_client(sample_oauth_token)
+
+        client.delete_bookmarks(["1", "2", "3"])
+
+        sleep.assert_not_called()
+
+    def test_rate_limit_wait_time_is_clamped(
+        self, sample_oauth_token: OAuth2Token, mocker: MockerFixture
+    ) -> None:
+        """Test a far-off reset never sleeps longer than the maximum wait."""
+        headers = _rate_limit_headers(0, 10 * MAX_RATE_LIMIT_WAIT_SECONDS)
+        mocker.patch.object(HTTPAdapter, "send", side_effect=_delete_responder(headers))
+        sleep = mocker.patch("x2raindrop_cli.x.client.time.sleep")
+        client = self._make_client(sample_oauth_token)
+
+        client.delete_bookmarks(["1", "2"])
+
+        sleep.assert_called_once_with(MAX_RATE_LIMIT_WAIT_SECONDS)
+
+    def test_exhausted_get_budget_does_not_delay_deletes(
+        self, sample_oauth_token: OAuth2Token, mocker: MockerFixture
+    ) -> None:
+        """Test rate limits are tracked per endpoint, so an exhausted GET budget never blocks deletes."""
+        respond_delete = _delete_responder()
+
+        def send(request: requests.PreparedRequest, *args: Any, **kwargs: Any) -> requests.Response:
+            if request.method != "GET":
+                return respond_delete(request, *args, **kwargs)
+            response = respond_delete(request, *args, **kwargs)
+            response.headers.update(_rate_limit_headers(0, 600))
+            response.raw = io.BytesIO(
+                orjson.dumps({"data": {"id": "42", "name": "N", "username": "n"}})
+            )
+            return response
+
+        mocker.patch.object(HTTPAdapter, "send", side_effect=send)
+        sleep = mocker.patch("x2raindrop_cli.x.client.time.sleep")
+        client = XClient(sample_oauth_token)
+
+        assert client.get_authenticated_user_id() == "42"
+        results = client.delete_bookmarks(["1", "2"])
+
+        assert results == {"1": None, "2": None}
+        sleep.assert_not_called()
+
 
 class TestBookmarkItemParsing:
     """Tests for BookmarkItem creation and parsing logic."""